@@ -71,6 +71,10 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = 100
 
+    # Worker threads for blocking I/O (boto3 S3 calls via asyncio.to_thread,
+    # sync FastAPI dependencies via anyio)
+    thread_pool_size: int = 64
+
     # S3 (bucket name will auto-append AWS account ID on first startup via start.sh)
     s3_bucket: str = "awesome-skills-platform"
 
@@ -93,6 +97,10 @@ class Settings(BaseSettings):
     # Default: /tmp/agent-platform-workspaces (can be changed to persistent location)
     agent_workspaces_dir: str = "/tmp/agent-platform-workspaces"
 
+    # Persistent git working trees for installed plugins, reused across updates
+    # so only new objects are fetched instead of re-cloning the whole repository
+    plugin_cache_dir: str = "/tmp/agent-platform-plugin-cache"
+
     # Built-in Sandbox Configuration (Claude Agent SDK native bash sandboxing)
     sandbox_enabled_default: bool = True  # Default sandbox state for new agents (enabled for security)
     sandbox_auto_allow_bash: bool = True  # Auto-approve bash when sandboxed
@@ -1,8 +1,13 @@
 """Plugin management for installing plugins from Git repositories."""
 import asyncio
+import os
+import re
 import shutil
+import tarfile
 import tempfile
 import logging
+import urllib.parse
+import urllib.request
 from pathlib import Path
 from dataclasses import dataclass
 from typing import Optional
@@ -10,6 +15,11 @@ from typing import Optional
 import json
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlSafeLoader
+
 from config import settings
 from database import db
 from core.skill_manager import SkillManager
@@ -17,6 +27,12 @@ from core.exceptions import PluginNotFoundException, ValidationException
 
 logger = logging.getLogger(__name__)
 
+# Matches org/repo at the end of git URLs:
+#   https://github.com/org/repo.git
+#   https://github.com/org/repo
+#   git@github.com:org/repo.git
+_REPO_RE = re.compile(r'[/:]([^/:]+)/([^/]+?)(?:\.git)?$')
+
 
 @dataclass
 class PluginMetadata:
@@ -39,8 +55,34 @@ class PluginManager:
       - skill-b/SKILL.md, ...
     """
 
+    # Upper bound on skills installed/removed concurrently per plugin
+    MAX_CONCURRENT_SKILL_OPS = 8
+
+    # Directories checked out from plugin repositories (top-level files are always included)
+    PLUGIN_SPARSE_PATHS = (".claude-plugin", "skills")
+
+    # Leading characters of README.md scanned for a plugin description
+    README_SCAN_CHARS = 4096
+
+    # Timeout for repository tarball downloads
+    ARCHIVE_TIMEOUT_SECONDS = 60
+
     def __init__(self):
         self.skill_manager = SkillManager()
+        self.plugin_cache_dir = Path(settings.plugin_cache_dir)
+        # Per-plugin locks guarding the shared working tree in plugin_cache_dir
+        self._plugin_locks: dict[str, asyncio.Lock] = {}
+
+    def _get_plugin_cache_dir(self, plugin_id: str) -> Path:
+        """Get the persistent git working tree path for a plugin."""
+        return self.plugin_cache_dir / plugin_id / "repo"
+
+    def _get_plugin_lock(self, plugin_id: str) -> asyncio.Lock:
+        """Get the lock serializing updates/uninstalls of one plugin."""
+        lock = self._plugin_locks.get(plugin_id)
+        if lock is None:
+            lock = self._plugin_locks[plugin_id] = asyncio.Lock()
+        return lock
 
     async def install_from_git(self, git_url: str, git_ref: str = "main") -> dict:
         """Install a plugin from a Git repository.
@@ -61,26 +103,34 @@ class PluginManager:
             temp_dir = Path(tempfile.mkdtemp(prefix="plugin_"))
             clone_dir = temp_dir / "repo"
 
-            logger.info(f"Cloning {git_url} (ref: {git_ref}) to {clone_dir}")
+            # Hosts that serve tarballs skip the git protocol entirely. The ref is
+            # resolved first and the archive fetched by commit, so the recorded
+            # SHA always matches the extracted content even if the ref moves.
+            git_sha = None
+            fetched = False
+            if self._get_archive_url(git_url, git_ref):
+                git_sha = await self._resolve_remote_sha(git_url, git_ref)
+                if git_sha:
+                    fetched = await self._fetch_archive(git_url, git_sha, clone_dir)
 
-            # Clone the repository
-            process = await asyncio.create_subprocess_exec(
-                "git", "clone", "--depth", "1", "--branch", git_ref,
-                git_url, str(clone_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
+            if not fetched:
+                logger.info(f"Cloning {git_url} (ref: {git_ref}) to {clone_dir}")
 
-            if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown git error"
-                raise ValidationException(
-                    message="Failed to clone repository",
-                    detail=error_msg
-                )
+                # Clone the repository
+                returncode, stderr = await self._clone_repo(git_url, git_ref, clone_dir)
+
+                if returncode != 0:
+                    error_msg = stderr or "Unknown git error"
+                    raise ValidationException(
+                        message="Failed to clone repository",
+                        detail=error_msg
+                    )
+
+                # Record the installed commit so updates can detect no-op refreshes
+                git_sha = await self._resolve_local_sha(clone_dir)
 
             # Parse plugin.yaml or auto-detect
-            metadata = self._parse_plugin_yaml(clone_dir, git_url)
+            metadata = await self._parse_plugin_yaml(clone_dir, git_url)
 
             # Check if plugin already exists
             existing = await self._find_plugin_by_git_url(git_url)
@@ -99,6 +149,7 @@ class PluginManager:
                 "description": metadata.description,
                 "git_url": git_url,
                 "git_ref": git_ref,
+                "git_sha": git_sha,
                 "version": metadata.version,
                 "author": metadata.author,
                 "skill_ids": skill_ids,
@@ -123,11 +174,14 @@ class PluginManager:
         finally:
             # Cleanup temp directory
             if temp_dir and temp_dir.exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
+                await self._remove_tree(temp_dir)
 
     async def update_plugin(self, plugin_id: str, git_ref: Optional[str] = None) -> dict:
         """Update an installed plugin by pulling latest from git.
 
+        Updates of the same plugin run one at a time, since they share the
+        plugin's cached working tree.
+
         Args:
             plugin_id: ID of the plugin to update
             git_ref: Optional new git ref to checkout
@@ -135,34 +189,38 @@ class PluginManager:
         Returns:
             Updated plugin record
         """
+        async with self._get_plugin_lock(plugin_id):
+            return await self._update_plugin(plugin_id, git_ref)
+
+    async def _update_plugin(self, plugin_id: str, git_ref: Optional[str]) -> dict:
+        """Update a plugin; the caller holds the plugin's lock."""
         plugin = await db.plugins.get(plugin_id)
         if not plugin:
+            self._plugin_locks.pop(plugin_id, None)
             raise PluginNotFoundException(
                 detail=f"Plugin with ID '{plugin_id}' does not exist"
             )
 
+        git_url = plugin["git_url"]
+        ref = git_ref or plugin["git_ref"]
+
+        # Skip the fetch entirely when the remote ref still points at the installed commit
+        if ref == plugin["git_ref"] and plugin.get("git_sha") and plugin.get("status") == "installed":
+            remote_sha = await self._resolve_remote_sha(git_url, ref)
+            if remote_sha == plugin["git_sha"]:
+                logger.info(f"Plugin {plugin['name']} is up to date at {remote_sha[:12]}, no update available")
+                return plugin
+
         # Update status to updating
         await db.plugins.update(plugin_id, {"status": "updating"})
 
-        temp_dir = None
         try:
-            git_url = plugin["git_url"]
-            ref = git_ref or plugin["git_ref"]
-
-            # Clone fresh copy
-            temp_dir = Path(tempfile.mkdtemp(prefix="plugin_update_"))
-            clone_dir = temp_dir / "repo"
-
-            process = await asyncio.create_subprocess_exec(
-                "git", "clone", "--depth", "1", "--branch", ref,
-                git_url, str(clone_dir),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
+            # Reuse the cached working tree so only new objects are fetched
+            clone_dir = self._get_plugin_cache_dir(plugin_id)
+            returncode, stderr = await self._sync_plugin_cache(clone_dir, git_url, ref)
 
-            if process.returncode != 0:
-                error_msg = stderr.decode() if stderr else "Unknown git error"
+            if returncode != 0:
+                error_msg = stderr or "Unknown git error"
                 await db.plugins.update(plugin_id, {
                     "status": "error",
                     "error_message": error_msg
@@ -172,8 +230,10 @@ class PluginManager:
                     detail=error_msg
                 )
 
+            git_sha = await self._resolve_local_sha(clone_dir)
+
             # Parse plugin.yaml or auto-detect
-            metadata = self._parse_plugin_yaml(clone_dir, git_url)
+            metadata = await self._parse_plugin_yaml(clone_dir, git_url)
 
             # Remove old skills
             await self._remove_skills(plugin.get("skill_ids", []))
@@ -187,6 +247,7 @@ class PluginManager:
                 "description": metadata.description,
                 "author": metadata.author,
                 "git_ref": ref,
+                "git_sha": git_sha,
                 "skill_ids": skill_ids,
                 "status": "installed",
                 "error_message": None,
@@ -204,9 +265,75 @@ class PluginManager:
                 "error_message": str(e)
             })
             raise
-        finally:
-            if temp_dir and temp_dir.exists():
-                shutil.rmtree(temp_dir, ignore_errors=True)
+
+    async def _sync_plugin_cache(self, clone_dir: Path, git_url: str, ref: str) -> tuple[int, str]:
+        """Bring a plugin's cached working tree to the given ref.
+
+        Fetches into the existing tree when present, otherwise (or if the
+        fetch fails) falls back to a fresh shallow clone.
+
+        Args:
+            clone_dir: Cached working tree path
+            git_url: Git repository URL
+            ref: Branch, tag, or commit to checkout
+
+        Returns:
+            Tuple of (returncode, stderr) of the last git command run
+        """
+        if (clone_dir / ".git").exists():
+            returncode, _, stderr = await self._run_git(
+                "-C", str(clone_dir), "fetch", "--depth", "1", "origin", ref,
+            )
+            if returncode == 0:
+                returncode, _, stderr = await self._run_git(
+                    "-C", str(clone_dir), "checkout", "--force", "FETCH_HEAD",
+                )
+            if returncode == 0:
+                return returncode, stderr
+            logger.warning(f"Failed to refresh cached repo {clone_dir}, re-cloning: {stderr}")
+
+        if clone_dir.exists():
+            await self._remove_tree(clone_dir)
+        clone_dir.parent.mkdir(parents=True, exist_ok=True)
+
+        return await self._clone_repo(git_url, ref, clone_dir)
+
+    async def _clone_repo(self, git_url: str, ref: str, clone_dir: Path) -> tuple[int, str]:
+        """Shallow-clone only the parts of a plugin repository that are read.
+
+        Uses a blobless sparse clone limited to PLUGIN_SPARSE_PATHS, falling
+        back to a plain shallow clone when the server or the local git does
+        not support partial/sparse clones.
+
+        Args:
+            git_url: Git repository URL
+            ref: Branch, tag, or commit to checkout
+            clone_dir: Destination directory
+
+        Returns:
+            Tuple of (returncode, stderr) of the last git command run
+        """
+        returncode, _, stderr = await self._run_git(
+            "clone", "--depth", "1", "--filter=blob:none", "--sparse",
+            "--branch", ref, git_url, str(clone_dir),
+        )
+        if returncode == 0:
+            # Cone mode always keeps top-level files (plugin.yaml, README.md)
+            returncode, _, stderr = await self._run_git(
+                "-C", str(clone_dir), "sparse-checkout", "set", *self.PLUGIN_SPARSE_PATHS,
+            )
+            if returncode == 0:
+                return returncode, stderr
+
+        logger.warning(f"Sparse clone of {git_url} failed, falling back to full clone: {stderr}")
+        if clone_dir.exists():
+            await self._remove_tree(clone_dir)
+
+        returncode, _, stderr = await self._run_git(
+            "clone", "--depth", "1", "--branch", ref,
+            git_url, str(clone_dir),
+        )
+        return returncode, stderr
 
     async def uninstall_plugin(self, plugin_id: str) -> bool:
         """Uninstall a plugin and all its associated skills.
@@ -217,20 +344,29 @@ class PluginManager:
         Returns:
             True if successfully uninstalled
         """
-        plugin = await db.plugins.get(plugin_id)
-        if not plugin:
-            raise PluginNotFoundException(
-                detail=f"Plugin with ID '{plugin_id}' does not exist"
-            )
+        # Wait for any in-flight update, which uses the cached working tree
+        async with self._get_plugin_lock(plugin_id):
+            plugin = await db.plugins.get(plugin_id)
+            if not plugin:
+                self._plugin_locks.pop(plugin_id, None)
+                raise PluginNotFoundException(
+                    detail=f"Plugin with ID '{plugin_id}' does not exist"
+                )
 
-        # Remove associated skills
-        skill_ids = plugin.get("skill_ids", [])
-        await self._remove_skills(skill_ids)
+            # Remove associated skills
+            skill_ids = plugin.get("skill_ids", [])
+            await self._remove_skills(skill_ids)
 
-        # Delete plugin record
-        await db.plugins.delete(plugin_id)
-        logger.info(f"Uninstalled plugin: {plugin['name']} with {len(skill_ids)} skills")
-        return True
+            # Drop the cached working tree used by updates
+            cache_dir = self._get_plugin_cache_dir(plugin_id).parent
+            if cache_dir.exists():
+                await self._remove_tree(cache_dir)
+
+            # Delete plugin record
+            await db.plugins.delete(plugin_id)
+            self._plugin_locks.pop(plugin_id, None)
+            logger.info(f"Uninstalled plugin: {plugin['name']} with {len(skill_ids)} skills")
+            return True
 
     async def list_plugins(self) -> list[dict]:
         """List all installed plugins."""
@@ -245,6 +381,127 @@ class PluginManager:
             )
         return plugin
 
+    def _get_archive_url(self, git_url: str, ref: str) -> Optional[str]:
+        """Get the tarball download URL for a GitHub/GitLab HTTPS repository.
+
+        Returns None for other hosts and SSH URLs, which must be cloned.
+        """
+        parsed = urllib.parse.urlparse(git_url)
+        if parsed.scheme != "https":
+            return None
+
+        repo_path = parsed.path.strip("/")
+        if repo_path.endswith(".git"):
+            repo_path = repo_path[:-len(".git")]
+        if repo_path.count("/") < 1:
+            return None
+
+        quoted_ref = urllib.parse.quote(ref, safe="")
+        if parsed.netloc == "github.com":
+            return f"https://github.com/{repo_path}/archive/{quoted_ref}.tar.gz"
+        if parsed.netloc == "gitlab.com":
+            repo_name = repo_path.rsplit("/", 1)[-1]
+            return f"https://gitlab.com/{repo_path}/-/archive/{quoted_ref}/{repo_name}-{quoted_ref}.tar.gz"
+        return None
+
+    async def _fetch_archive(self, git_url: str, ref: str, dest_dir: Path) -> bool:
+        """Download and extract a repository tarball instead of cloning.
+
+        Args:
+            git_url: Git repository URL
+            ref: Commit SHA (or branch/tag) to download
+            dest_dir: Directory to extract the repository into
+
+        Returns:
+            True if the archive was extracted, False if the caller should clone
+        """
+        archive_url = self._get_archive_url(git_url, ref)
+        # Safe extraction relies on tarfile's data filter (Python 3.11.4+)
+        if not archive_url or not hasattr(tarfile, "data_filter"):
+            return False
+
+        logger.info(f"Downloading {archive_url} to {dest_dir}")
+        try:
+            await asyncio.to_thread(self._extract_archive, archive_url, dest_dir)
+            return True
+        except Exception as e:
+            logger.warning(f"Archive download of {git_url} failed, falling back to git clone: {e}")
+            if dest_dir.exists():
+                await self._remove_tree(dest_dir)
+            return False
+
+    def _extract_archive(self, archive_url: str, dest_dir: Path) -> None:
+        """Stream a .tar.gz archive into dest_dir (blocking).
+
+        Strips the archive's top-level directory and, like the sparse clone,
+        keeps only top-level files and PLUGIN_SPARSE_PATHS.
+        """
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        with urllib.request.urlopen(archive_url, timeout=self.ARCHIVE_TIMEOUT_SECONDS) as response:
+            with tarfile.open(fileobj=response, mode="r|gz") as tar:
+                for member in tar:
+                    _, _, relative_name = member.name.partition("/")
+                    if not relative_name:
+                        continue
+                    top_level = relative_name.split("/", 1)[0]
+                    is_top_level_file = "/" not in relative_name and not member.isdir()
+                    if top_level not in self.PLUGIN_SPARSE_PATHS and not is_top_level_file:
+                        continue
+                    member.name = relative_name
+                    tar.extract(member, dest_dir, filter="data")
+
+    async def _resolve_remote_sha(self, git_url: str, ref: str) -> Optional[str]:
+        """Resolve a branch or tag to its commit SHA with a single ls-remote round-trip.
+
+        Returns None if the ref cannot be resolved (e.g. it is a commit SHA
+        rather than a ref, or the remote is unreachable).
+        """
+        # The explicit "^{}" pattern makes ls-remote include peeled annotated tags
+        returncode, stdout, _ = await self._run_git("ls-remote", git_url, ref, f"{ref}^{{}}")
+        if returncode != 0:
+            return None
+
+        refs = {}
+        for line in stdout.splitlines():
+            sha, _, name = line.partition("\t")
+            refs[name] = sha
+
+        # Prefer the peeled tag, which names the commit rather than the tag object
+        for name in (f"refs/tags/{ref}^{{}}", f"refs/heads/{ref}", f"refs/tags/{ref}", ref):
+            if name in refs:
+                return refs[name]
+        return None
+
+    async def _resolve_local_sha(self, repo_dir: Path) -> Optional[str]:
+        """Get the commit SHA checked out in a local repository."""
+        returncode, stdout, _ = await self._run_git("-C", str(repo_dir), "rev-parse", "HEAD")
+        return stdout.strip() if returncode == 0 else None
+
+    async def _remove_tree(self, path: Path) -> None:
+        """Recursively delete a directory in a worker thread, ignoring errors."""
+        await asyncio.to_thread(shutil.rmtree, path, ignore_errors=True)
+
+    async def _run_git(self, *args: str) -> tuple[int, str, str]:
+        """Run a git command without blocking the event loop.
+
+        Args:
+            *args: Arguments passed to the git executable
+
+        Returns:
+            Tuple of (returncode, stdout, stderr) with output decoded as text
+        """
+        process = await asyncio.create_subprocess_exec(
+            "git", *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        return (
+            process.returncode,
+            stdout.decode(errors="replace") if stdout else "",
+            stderr.decode(errors="replace") if stderr else "",
+        )
+
     def _detect_marketplace(self, repo_dir: Path) -> str | None:
         """Detect if repository is a marketplace by checking .claude-plugin/marketplace.json.
 
@@ -267,7 +524,15 @@ class PluginManager:
                 logger.warning(f"Failed to parse marketplace.json: {e}")
         return None
 
-    def _parse_plugin_yaml(self, repo_dir: Path, git_url: str = "") -> PluginMetadata:
+    async def _parse_plugin_yaml(self, repo_dir: Path, git_url: str = "") -> PluginMetadata:
+        """Parse plugin.yaml or auto-detect skills without blocking the event loop.
+
+        The manifest, marketplace.json and README reads plus the skills/ scan
+        all run in a worker thread.
+        """
+        return await asyncio.to_thread(self._parse_plugin_yaml_sync, repo_dir, git_url)
+
+    def _parse_plugin_yaml_sync(self, repo_dir: Path, git_url: str = "") -> PluginMetadata:
         """Parse plugin.yaml from repository directory, or auto-detect skills.
 
         Args:
@@ -289,7 +554,8 @@ class PluginManager:
         if plugin_yaml.exists():
             try:
                 with open(plugin_yaml, 'r', encoding='utf-8') as f:
-                    data = yaml.safe_load(f)
+                    content = f.read()
+                data = self._load_manifest(content)
             except yaml.YAMLError as e:
                 raise ValidationException(
                     message="Invalid plugin.yaml",
@@ -305,12 +571,15 @@ class PluginManager:
                     detail=f"Missing required fields: {', '.join(missing)}"
                 )
 
+            # Manifests without a skills list install every skill in skills/
+            skills = data.get("skills") or self._detect_skills(repo_dir / "skills")
+
             return PluginMetadata(
                 name=data["name"],
                 version=data["version"],
                 description=data["description"],
                 author=data.get("author", "unknown"),
-                skills=data.get("skills", []),
+                skills=skills,
                 marketplace=marketplace
             )
 
@@ -323,10 +592,7 @@ class PluginManager:
             )
 
         # Auto-detect skills
-        detected_skills = []
-        for item in skills_dir.iterdir():
-            if item.is_dir() and (item / "SKILL.md").exists():
-                detected_skills.append(item.name)
+        detected_skills = self._detect_skills(skills_dir)
 
         if not detected_skills:
             raise ValidationException(
@@ -342,13 +608,14 @@ class PluginManager:
         readme_path = repo_dir / "README.md"
         if readme_path.exists():
             try:
-                with open(readme_path, 'r', encoding='utf-8') as f:
-                    # Get first non-empty, non-heading line as description
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            description = line[:200]  # Limit description length
-                            break
+                with open(readme_path, 'r', encoding='utf-8', errors='replace') as f:
+                    head = f.read(self.README_SCAN_CHARS)
+                # Get first non-empty, non-heading line as description
+                for line in head.splitlines():
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        description = line[:200]  # Limit description length
+                        break
             except Exception:
                 pass
 
@@ -364,14 +631,34 @@ class PluginManager:
             marketplace=marketplace
         )
 
+    def _detect_skills(self, skills_dir: Path) -> list[str]:
+        """List skill directory names (those containing SKILL.md) in skills_dir."""
+        if not skills_dir.is_dir():
+            return []
+        # DirEntry caches the type from readdir, saving a stat per entry
+        with os.scandir(skills_dir) as entries:
+            return [
+                entry.name for entry in entries
+                if entry.is_dir(follow_symlinks=False)
+                and os.path.exists(os.path.join(entry.path, "SKILL.md"))
+            ]
+
+    def _load_manifest(self, content: str):
+        """Parse plugin.yaml content.
+
+        JSON is valid YAML, so JSON-style manifests go through the C-accelerated
+        json module first; everything else uses the libyaml-backed loader.
+        """
+        if content.lstrip().startswith('{'):
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                pass  # YAML flow mapping, not strict JSON
+        return yaml.load(content, Loader=_YamlSafeLoader)
+
     def _extract_repo_name(self, git_url: str) -> str:
         """Extract repository name from git URL."""
-        import re
-        # Handle various git URL formats:
-        # https://github.com/org/repo.git
-        # https://github.com/org/repo
-        # git@github.com:org/repo.git
-        match = re.search(r'[/:]([^/:]+)/([^/]+?)(?:\.git)?$', git_url)
+        match = _REPO_RE.search(git_url)
         if match:
             return match.group(2)
         return "unknown-plugin"
@@ -391,25 +678,87 @@ class PluginManager:
             logger.warning(f"Plugin {metadata.name} has no skills directory")
             return []
 
-        skill_ids = []
-        skills_to_install = metadata.skills if metadata.skills else [
-            d.name for d in skills_dir.iterdir() if d.is_dir()
-        ]
+        # Skills are independent S3 uploads + DB writes, so install them
+        # concurrently, bounded to avoid flooding S3 with parallel PUTs
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SKILL_OPS)
+        skill_paths = [skills_dir / skill_name for skill_name in metadata.skills]
+        results = await asyncio.gather(*(
+            self._install_one_skill(skill_path, metadata, semaphore)
+            for skill_path in skill_paths
+        ))
+        uploaded = [(path, record) for path, record in zip(skill_paths, results) if record]
+        if not uploaded:
+            return []
+
+        # Create all skill records in one batched DB write
+        try:
+            skills = await db.skills.put_many([record for _, record in uploaded])
+        except Exception as e:
+            # Records carry their IDs by now, so rewriting any that did
+            # land before the failure is harmless
+            logger.error(f"Batch write of skills for plugin {metadata.name} failed, retrying one by one: {e}")
+            skills = await self._put_skills_individually(uploaded)
+
+        for skill in skills:
+            logger.info(f"Installed skill: {skill['name']} (ID: {skill['id']})")
+        return [skill["id"] for skill in skills]
+
+    async def _put_skills_individually(self, uploaded: list[tuple[Path, dict]]) -> list[dict]:
+        """Write skill records one at a time, skipping those that fail.
+
+        A skill whose record cannot be written has its uploaded S3 draft
+        discarded so it is not left orphaned.
+
+        Args:
+            uploaded: (skill directory, skill record) pairs in manifest order
+
+        Returns:
+            Skill records that were written
+        """
+        skills = []
+        for skill_path, record in uploaded:
+            try:
+                skills.append(await db.skills.put(record))
+            except Exception as e:
+                logger.error(f"Failed to install skill {skill_path.name}: {e}")
+                try:
+                    await self.skill_manager.discard_draft(skill_path.name)
+                except Exception as cleanup_error:
+                    logger.warning(f"Failed to discard draft for skill {skill_path.name}: {cleanup_error}")
+        return skills
+
+    async def _install_one_skill(
+        self,
+        skill_path: Path,
+        metadata: PluginMetadata,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[dict]:
+        """Upload a single skill from a plugin repository and build its DB record.
+
+        Args:
+            skill_path: Path to the skill directory
+            metadata: Plugin metadata
+            semaphore: Semaphore bounding concurrent installs
 
-        for skill_name in skills_to_install:
-            skill_path = skills_dir / skill_name
-            if not skill_path.exists():
-                logger.warning(f"Skill {skill_name} not found in {skills_dir}")
-                continue
+        Returns:
+            Skill record to create, or None if the skill was skipped or failed
+        """
+        skill_name = skill_path.name
+        if not skill_path.exists():
+            logger.warning(f"Skill {skill_name} not found in {skill_path.parent}")
+            return None
 
-            skill_md = skill_path / "SKILL.md"
-            if not skill_md.exists():
-                logger.warning(f"Skill {skill_name} missing SKILL.md, skipping")
-                continue
+        skill_md = skill_path / "SKILL.md"
+        if not skill_md.exists():
+            logger.warning(f"Skill {skill_name} missing SKILL.md, skipping")
+            return None
 
+        async with semaphore:
             try:
                 # Extract skill metadata
-                skill_metadata = self.skill_manager.extract_skill_metadata(skill_path)
+                skill_metadata = await asyncio.to_thread(
+                    self.skill_manager.extract_skill_metadata, skill_path
+                )
 
                 # Upload to S3 as draft
                 s3_location = await self.skill_manager.upload_to_draft(
@@ -417,7 +766,7 @@ class PluginManager:
                     skill_path
                 )
 
-                # Create skill record in DB
+                # Skill record, written to the DB in one batch by the caller
                 skill_data = {
                     "name": skill_metadata.name,
                     "description": skill_metadata.description,
@@ -432,15 +781,11 @@ class PluginManager:
                     "plugin_id": None,  # Will be set after plugin is created
                 }
 
-                skill = await db.skills.put(skill_data)
-                skill_ids.append(skill["id"])
-                logger.info(f"Installed skill: {skill_name} (ID: {skill['id']})")
+                return skill_data
 
             except Exception as e:
                 logger.error(f"Failed to install skill {skill_name}: {e}")
-                continue
-
-        return skill_ids
+                return None
 
     async def _remove_skills(self, skill_ids: list[str]) -> int:
         """Remove skills by their IDs.
@@ -451,34 +796,47 @@ class PluginManager:
         Returns:
             Number of skills removed
         """
-        removed = 0
-        for skill_id in skill_ids:
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_SKILL_OPS)
+        results = await asyncio.gather(*(
+            self._remove_one_skill(skill_id, semaphore) for skill_id in skill_ids
+        ))
+        return sum(results)
+
+    async def _remove_one_skill(self, skill_id: str, semaphore: asyncio.Semaphore) -> bool:
+        """Remove a single skill's S3 files and DB record.
+
+        Args:
+            skill_id: ID of the skill to remove
+            semaphore: Semaphore bounding concurrent removals
+
+        Returns:
+            True if the skill was removed
+        """
+        async with semaphore:
             try:
                 skill = await db.skills.get(skill_id)
-                if skill:
-                    # Delete from S3
-                    if skill.get("s3_location"):
-                        try:
-                            await self.skill_manager.delete_skill_files(skill["name"])
-                        except Exception as e:
-                            logger.warning(f"Failed to delete S3 files for skill {skill_id}: {e}")
-
-                    # Delete from DB
-                    await db.skills.delete(skill_id)
-                    removed += 1
-                    logger.info(f"Removed skill: {skill_id}")
+                if not skill:
+                    return False
+
+                # Delete from S3
+                if skill.get("s3_location"):
+                    try:
+                        await self.skill_manager.delete_skill_files(skill["name"])
+                    except Exception as e:
+                        logger.warning(f"Failed to delete S3 files for skill {skill_id}: {e}")
+
+                # Delete from DB
+                await db.skills.delete(skill_id)
+                logger.info(f"Removed skill: {skill_id}")
+                return True
             except Exception as e:
                 logger.error(f"Failed to remove skill {skill_id}: {e}")
-                continue
-        return removed
+                return False
 
     async def _find_plugin_by_git_url(self, git_url: str) -> Optional[dict]:
         """Find an existing plugin by its git URL."""
-        plugins = await db.plugins.list()
-        for plugin in plugins:
-            if plugin.get("git_url") == git_url:
-                return plugin
-        return None
+        plugins = await db.plugins.find_by("git_url", git_url)
+        return plugins[0] if plugins else None
 
 
 # Singleton instance
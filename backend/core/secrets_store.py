@@ -0,0 +1,80 @@
+"""Storage for write-only runtime secrets (API keys, AWS secrets, tokens).
+
+Secrets entered through the settings API are never written to the database;
+only their presence is persisted (*_set flags). The values themselves live in
+a SecretsStore so the storage backend can be swapped without touching callers.
+"""
+import os
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+# AES-GCM nonce length in bytes (the 96-bit size recommended for GCM)
+_NONCE_SIZE = 12
+
+
+class SecretsStore(ABC):
+    """Abstract key/value store for runtime secrets."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def get(self, name: str) -> Optional[str]:
+        """Get a secret by name, or None if it is not set."""
+        pass
+
+    @abstractmethod
+    def has(self, name: str) -> bool:
+        """Check whether a secret is set, without reading its value."""
+        pass
+
+    @abstractmethod
+    def set(self, name: str, value: str) -> None:
+        """Store a secret, replacing any previous value."""
+        pass
+
+    @abstractmethod
+    def delete(self, name: str) -> None:
+        """Remove a secret (no-op if it is not set)."""
+        pass
+
+
+class InMemorySecretsStore(SecretsStore):
+    """Process-local secrets store (cleared on restart).
+
+    Each worker process holds its own copy, so a secret set through one
+    worker is not visible to the others. Values are kept AES-GCM encrypted
+    under a key generated per process, so they never sit in memory (or a
+    core dump) as plaintext between reads.
+    """
+
+    __slots__ = ("_values", "_cipher")
+
+    def __init__(self):
+        # name -> nonce + ciphertext
+        self._values: dict[str, bytes] = {}
+        self._cipher = AESGCM(AESGCM.generate_key(bit_length=256))
+
+    def get(self, name: str) -> Optional[str]:
+        sealed = self._values.get(name)
+        if sealed is None:
+            return None
+        nonce, ciphertext = sealed[:_NONCE_SIZE], sealed[_NONCE_SIZE:]
+        return self._cipher.decrypt(nonce, ciphertext, name.encode()).decode()
+
+    def has(self, name: str) -> bool:
+        return name in self._values
+
+    def set(self, name: str, value: str) -> None:
+        # The name is bound as associated data so a value cannot be
+        # swapped into another secret's slot
+        nonce = os.urandom(_NONCE_SIZE)
+        self._values[name] = nonce + self._cipher.encrypt(nonce, value.encode(), name.encode())
+
+    def delete(self, name: str) -> None:
+        self._values.pop(name, None)
+
+
+# Global instance
+secrets_store: SecretsStore = InMemorySecretsStore()
@@ -76,10 +76,13 @@ class SessionManager:
                 "id": session_id,
                 "agent_id": agent_id,
                 "title": title,
-                "user_id": user_id,
                 "created_at": now,
                 "last_accessed": now,
             }
+            # user_id is the user_id-index hash key, so it must be omitted
+            # rather than stored as NULL for anonymous sessions
+            if user_id is not None:
+                session_data["user_id"] = user_id
             await db.sessions.put(session_data)
             session_info = SessionInfo.from_dict(session_data)
 
@@ -14,13 +14,18 @@ Directory structure:
         └── skill-3/
 
     /tmp/agent-platform-workspaces/      <- Isolated agent workspaces (outside project!)
+    ├── .manifests/{agent_id}.json       <- Linked skill names per agent (not agent-visible)
     └── {agent_id}/
         └── .claude/skills/              <- Absolute symlinks to allowed skills only
             ├── skill-1 -> /home/ubuntu/.../workspace/.claude/skills/skill-1
             └── skill-2 -> /home/ubuntu/.../workspace/.claude/skills/skill-2
 """
+import json
 import logging
+import os
+import re
 import shutil
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -29,14 +34,34 @@ from database import db
 
 logger = logging.getLogger(__name__)
 
+# Skill folder name inside an s3://bucket/skills/{name}/... location
+_SKILL_FOLDER_RE = re.compile(r'/skills/([^/]+)/')
+
+# Characters replaced when deriving a folder name from a skill's display name
+_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
 
 class WorkspaceManager:
     """Manages per-agent workspaces with skill isolation via symlinks."""
 
+    # Directory holding each agent's manifest of linked skill names. It sits
+    # beside the agent workspaces, not inside them, so an agent cannot edit it
+    SKILL_MANIFESTS_DIR_NAME = ".manifests"
+
+    # Upper bound on how long get_all_skill_names may miss a SKILL.md added
+    # to or removed from an existing folder, which the directory mtime misses
+    SKILLS_CACHE_TTL_SECONDS = 5.0
+
     def __init__(self):
         self.main_workspace = Path(settings.agent_workspace_dir)
         self.agents_workspace = Path(settings.agent_workspaces_dir)
         self.main_skills_dir = self.main_workspace / ".claude" / "skills"
+        # Resolved once so symlink sources need no per-link realpath
+        self.main_skills_dir_abs = self.main_skills_dir.resolve()
+        # get_all_skill_names cache, keyed on the skills directory mtime
+        self._skills_cache: list[str] | None = None
+        self._skills_cache_mtime: int = -1
+        self._skills_cache_ts: float = 0.0
 
     def _ensure_dirs(self):
         """Ensure required directories exist."""
@@ -51,40 +76,88 @@ class WorkspaceManager:
         """Get the skills directory path for a specific agent."""
         return self.get_agent_workspace(agent_id) / ".claude" / "skills"
 
-    async def get_skill_name_by_id(self, skill_id: str) -> Optional[str]:
-        """Get skill folder name from skill ID.
+    def _get_skill_folder_name(self, skill: dict) -> str:
+        """Get skill folder name from a skill record.
 
         The skill folder name is extracted from s3_location or derived from skill name.
         """
-        skill = await db.skills.get(skill_id)
-        if not skill:
-            logger.warning(f"Skill not found: {skill_id}")
-            return None
-
         # Extract folder name from s3_location or draft_s3_location
         s3_location = skill.get("s3_location") or skill.get("draft_s3_location", "")
         if s3_location:
             # Extract from s3://bucket/skills/name/... format
-            import re
-            match = re.search(r'/skills/([^/]+)/', s3_location)
+            match = _SKILL_FOLDER_RE.search(s3_location)
             if match:
                 return match.group(1)
 
         # Fallback: sanitize skill name
-        import re
-        return re.sub(r'[^a-zA-Z0-9_-]', '-', skill.get("name", "").lower())
+        return _SANITIZE_RE.sub('-', skill.get("name", "").lower())
 
-    async def get_all_skill_names(self) -> list[str]:
-        """Get all available skill folder names."""
+    async def get_skill_name_by_id(self, skill_id: str) -> Optional[str]:
+        """Get skill folder name from skill ID."""
+        skill = await db.skills.get(skill_id)
+        if not skill:
+            logger.warning(f"Skill not found: {skill_id}")
+            return None
+        return self._get_skill_folder_name(skill)
+
+    async def get_skill_names_by_ids(self, skill_ids: list[str]) -> list[str]:
+        """Get skill folder names for several skill IDs with one batched lookup.
+
+        Names are returned in the order of skill_ids; unknown IDs are skipped.
+        """
+        skills = await db.skills.get_many(skill_ids)
         skill_names = []
-        if self.main_skills_dir.exists():
-            for item in self.main_skills_dir.iterdir():
-                if item.is_dir() and not item.name.startswith('.'):
-                    skill_md = item / "SKILL.md"
-                    if skill_md.exists():
-                        skill_names.append(item.name)
+        for skill_id in skill_ids:
+            skill = skills.get(skill_id)
+            if skill:
+                skill_names.append(self._get_skill_folder_name(skill))
+            else:
+                logger.warning(f"Skill not found: {skill_id}")
         return skill_names
 
+    async def get_all_skill_names(self) -> list[str]:
+        """Get all available skill folder names.
+
+        The scan is cached until the skills directory's mtime changes (a skill
+        folder is added, removed or renamed), SKILLS_CACHE_TTL_SECONDS pass, or
+        invalidate_skill_cache() is called. Writing SKILL.md into an existing
+        folder (as the skill-creator agent does) leaves the directory mtime
+        alone, so callers that write skill files invalidate explicitly and the
+        TTL bounds anything else.
+        """
+        try:
+            mtime = self.main_skills_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+        if (
+            self._skills_cache is not None
+            and mtime == self._skills_cache_mtime
+            and time.monotonic() - self._skills_cache_ts < self.SKILLS_CACHE_TTL_SECONDS
+        ):
+            return list(self._skills_cache)
+
+        # DirEntry.is_dir() reuses the type from readdir, so only the
+        # SKILL.md check costs a stat per skill
+        try:
+            with os.scandir(self.main_skills_dir) as entries:
+                skill_names = [
+                    entry.name for entry in entries
+                    if not entry.name.startswith('.')
+                    and entry.is_dir()
+                    and os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+                ]
+        except FileNotFoundError:
+            return []
+
+        self._skills_cache = skill_names
+        self._skills_cache_mtime = mtime
+        self._skills_cache_ts = time.monotonic()
+        return list(skill_names)
+
+    def invalidate_skill_cache(self):
+        """Force the next get_all_skill_names call to rescan the skills directory."""
+        self._skills_cache_mtime = -1
+
     async def rebuild_agent_workspace(
         self,
         agent_id: str,
@@ -106,9 +179,6 @@ class WorkspaceManager:
         agent_workspace = self.get_agent_workspace(agent_id)
         agent_skills_dir = self.get_agent_skills_dir(agent_id)
 
-        # Remove existing skills directory and recreate
-        if agent_skills_dir.exists():
-            shutil.rmtree(agent_skills_dir)
         agent_skills_dir.mkdir(parents=True, exist_ok=True)
 
         # Determine which skills to link
@@ -118,44 +188,128 @@ class WorkspaceManager:
             logger.info(f"Agent {agent_id}: linking ALL skills ({len(skill_names)} skills)")
         else:
             # Link only specified skills
-            skill_names = []
-            for skill_id in skill_ids:
-                skill_name = await self.get_skill_name_by_id(skill_id)
-                if skill_name:
-                    skill_names.append(skill_name)
-                else:
-                    logger.warning(f"Could not resolve skill ID to name: {skill_id}")
+            skill_names = await self.get_skill_names_by_ids(skill_ids)
             logger.info(f"Agent {agent_id}: linking {len(skill_names)} skills: {skill_names}")
 
-        # Create symlinks using ABSOLUTE paths
+        # Use ABSOLUTE paths for symlinks
         # This is critical for isolated workspaces outside the project tree
-        linked_count = 0
+        wanted = {}
         for skill_name in skill_names:
-            source_path = self.main_skills_dir / skill_name
+            source_path = self.main_skills_dir_abs / skill_name
             if source_path.exists():
-                target_path = agent_skills_dir / skill_name
-                # Use absolute path for symlink (required for isolated workspaces)
-                absolute_source = source_path.resolve()
-                try:
-                    target_path.symlink_to(absolute_source)
-                    linked_count += 1
-                    logger.debug(f"Created symlink: {target_path} -> {absolute_source}")
-                except OSError as e:
-                    logger.error(f"Failed to create symlink for {skill_name}: {e}")
+                wanted[skill_name] = source_path
             else:
                 logger.warning(f"Skill directory not found: {source_path}")
 
-        logger.info(f"Agent {agent_id} workspace rebuilt: {linked_count} skills linked")
+        # Diff against the current links instead of recreating every one
+        with os.scandir(agent_skills_dir) as entries:
+            existing = {entry.name: entry for entry in entries}
+
+        linked_names = []
+        removed_count = 0
+        for name, entry in existing.items():
+            if name in wanted and entry.is_symlink() and os.readlink(entry.path) == str(wanted[name]):
+                del wanted[name]  # Already linked to the right place
+                linked_names.append(name)
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+                removed_count += 1
+            except OSError as e:
+                logger.error(f"Failed to remove stale skill entry {entry.path}: {e}")
+
+        added_count = 0
+        for skill_name, absolute_source in wanted.items():
+            target_path = agent_skills_dir / skill_name
+            try:
+                os.symlink(absolute_source, target_path, target_is_directory=True)
+                linked_names.append(skill_name)
+                added_count += 1
+                logger.debug(f"Created symlink: {target_path} -> {absolute_source}")
+            except OSError as e:
+                logger.error(f"Failed to create symlink for {skill_name}: {e}")
+
+        self._write_skill_manifest(agent_id, linked_names)
+
+        logger.info(
+            f"Agent {agent_id} workspace rebuilt: {added_count} skills linked, "
+            f"{removed_count} removed, {len(existing) - removed_count} unchanged"
+        )
         return agent_workspace
 
+    def _get_skill_manifest_path(self, agent_id: str) -> Path:
+        """Get the path of the manifest listing an agent's linked skills."""
+        return self.agents_workspace / self.SKILL_MANIFESTS_DIR_NAME / f"{agent_id}.json"
+
+    def _write_skill_manifest(self, agent_id: str, skill_names: list[str]):
+        """Record the skill symlinks present in an agent's workspace."""
+        manifest_path = self._get_skill_manifest_path(agent_id)
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(manifest_path, 'w', encoding='utf-8') as f:
+                json.dump(sorted(skill_names), f)
+        except OSError as e:
+            logger.warning(f"Failed to write skill manifest for agent {agent_id}: {e}")
+
+    def _remove_linked_workspace(self, agent_id: str) -> bool:
+        """Remove an agent workspace using its skill manifest.
+
+        Unlinks the recorded symlinks directly and removes the then-empty
+        directories, avoiding a full rmtree walk over every link.
+
+        Returns:
+            True if the workspace was fully removed, False if the caller
+            should fall back to shutil.rmtree (no manifest, an invalid
+            manifest entry, or extra files)
+        """
+        manifest_path = self._get_skill_manifest_path(agent_id)
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                skill_names = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(skill_names, list):
+            return False
+
+        agent_skills_dir = self.get_agent_skills_dir(agent_id)
+        # Only bare folder names are valid, so no entry can point outside
+        # the agent's skills directory
+        for skill_name in skill_names:
+            if (
+                not isinstance(skill_name, str)
+                or skill_name in ("", ".", "..")
+                or skill_name != os.path.basename(skill_name)
+            ):
+                logger.warning(f"Invalid skill manifest entry for agent {agent_id}: {skill_name!r}")
+                return False
+
+        try:
+            for skill_name in skill_names:
+                link_path = agent_skills_dir / skill_name
+                # Anything other than a symlink is left for rmtree
+                if os.path.islink(link_path):
+                    os.unlink(link_path)
+            os.rmdir(agent_skills_dir)
+            os.rmdir(agent_skills_dir.parent)
+            os.rmdir(self.get_agent_workspace(agent_id))
+            return True
+        except OSError:
+            return False
+
     async def delete_agent_workspace(self, agent_id: str):
         """Delete an agent's workspace directory."""
         agent_workspace = self.get_agent_workspace(agent_id)
         if agent_workspace.exists():
-            shutil.rmtree(agent_workspace)
+            if not self._remove_linked_workspace(agent_id):
+                # No manifest, or the agent left other files behind
+                shutil.rmtree(agent_workspace)
             logger.info(f"Deleted workspace for agent {agent_id}")
         else:
             logger.debug(f"No workspace to delete for agent {agent_id}")
+        self._get_skill_manifest_path(agent_id).unlink(missing_ok=True)
 
     async def get_allowed_skill_names(
         self,
@@ -174,12 +328,7 @@ class WorkspaceManager:
         if allow_all_skills:
             return await self.get_all_skill_names()
 
-        skill_names = []
-        for skill_id in skill_ids:
-            skill_name = await self.get_skill_name_by_id(skill_id)
-            if skill_name:
-                skill_names.append(skill_name)
-        return skill_names
+        return await self.get_skill_names_by_ids(skill_ids)
 
     def workspace_exists(self, agent_id: str) -> bool:
         """Check if an agent's workspace exists."""
@@ -15,26 +15,51 @@ class BaseTable(ABC, Generic[T]):
         """Insert or update an item."""
         pass
 
+    @abstractmethod
+    async def put_many(self, items: list[T]) -> list[T]:
+        """Insert or update several items in batched writes."""
+        pass
+
     @abstractmethod
     async def get(self, item_id: str) -> Optional[T]:
         """Get an item by ID."""
         pass
 
+    @abstractmethod
+    async def get_many(self, item_ids: list[str]) -> dict[str, T]:
+        """Get several items by ID, keyed by ID (missing IDs are omitted)."""
+        pass
+
     @abstractmethod
     async def list(self, user_id: Optional[str] = None) -> list[T]:
         """List all items, optionally filtered by user_id."""
         pass
 
+    @abstractmethod
+    async def find_by(self, attribute: str, value) -> list[T]:
+        """List items whose attribute equals the given value."""
+        pass
+
     @abstractmethod
     async def delete(self, item_id: str) -> bool:
         """Delete an item by ID."""
         pass
 
+    @abstractmethod
+    async def delete_many(self, item_ids: list[str]) -> int:
+        """Delete several items by ID in batched writes. Returns count requested."""
+        pass
+
     @abstractmethod
     async def update(self, item_id: str, updates: dict) -> Optional[T]:
         """Update an item."""
         pass
 
+    @abstractmethod
+    async def patch(self, item_id: str, changes: dict) -> T:
+        """Set the given attributes on an item, creating it if missing."""
+        pass
+
 
 class BaseDatabase(ABC):
     """Abstract base class for database clients."""
@@ -85,3 +110,8 @@ class BaseDatabase(ABC):
     async def health_check(self) -> bool:
         """Check if the database is healthy."""
         pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Release connections held by the database client."""
+        pass
@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 import aioboto3
+import asyncio
+from contextlib import AsyncExitStack
 from datetime import datetime
+from functools import lru_cache
+import random
 import time
 from typing import Optional, TypeVar, Generic
 from uuid import uuid4
@@ -13,39 +17,67 @@ from database.base import BaseTable, BaseDatabase
 
 T = TypeVar("T", bound=dict)
 
+# DynamoDB limit on keys per BatchGetItem request
+BATCH_GET_MAX_KEYS = 100
+
+# Retries for BatchGetItem UnprocessedKeys, with capped exponential backoff
+BATCH_GET_MAX_RETRIES = 8
+BATCH_GET_BASE_DELAY_SECONDS = 0.05
+BATCH_GET_MAX_DELAY_SECONDS = 2.0
+
+
+@lru_cache(maxsize=64)
+def _update_expression(field_count: int) -> tuple[str, tuple[str, ...], tuple[str, ...]]:
+    """Build the positional SET expression for an update of field_count attributes.
+
+    Returns (expression, attribute name placeholders, attribute value placeholders).
+    """
+    attr_names = tuple(f"#attr{i}" for i in range(field_count))
+    attr_values = tuple(f":val{i}" for i in range(field_count))
+    expression = "SET " + ", ".join(f"{n} = {v}" for n, v in zip(attr_names, attr_values))
+    return expression, attr_names, attr_values
+
 
 class DynamoDBTable(BaseTable[T], Generic[T]):
     """DynamoDB table implementation of BaseTable interface."""
 
-    def __init__(self, table_name: str, session: aioboto3.Session):
+    def __init__(self, table_name: str, database: DynamoDBDatabase):
         self.table_name = table_name
-        self._session = session
-        self._resource = None
+        self._database = database
 
     async def _get_table(self):
-        """Get the DynamoDB table resource."""
-        if self._resource is None:
-            kwargs = {"region_name": settings.aws_region}
-            if settings.aws_access_key_id:
-                kwargs["aws_access_key_id"] = settings.aws_access_key_id
-                kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
-
-            async with self._session.resource("dynamodb", **kwargs) as dynamodb:
-                self._resource = await dynamodb.Table(self.table_name)
-        return self._resource
+        """Get the DynamoDB table resource (backed by the shared connection)."""
+        return await self._database.get_table(self.table_name)
 
     async def put(self, item: T) -> T:
         """Insert or update an item."""
+        now = datetime.now().isoformat()
         if "id" not in item:
             item["id"] = str(uuid4())
         if "created_at" not in item:
-            item["created_at"] = datetime.now().isoformat()
-        item["updated_at"] = datetime.now().isoformat()
+            item["created_at"] = now
+        item["updated_at"] = now
 
         table = await self._get_table()
         await table.put_item(Item=item)
         return item
 
+    async def put_many(self, items: list[T]) -> list[T]:
+        """Insert or update several items using batched writes (25 items per request)."""
+        now = datetime.now().isoformat()
+        for item in items:
+            if "id" not in item:
+                item["id"] = str(uuid4())
+            if "created_at" not in item:
+                item["created_at"] = now
+            item["updated_at"] = now
+
+        table = await self._get_table()
+        async with table.batch_writer() as batch:
+            for item in items:
+                await batch.put_item(Item=item)
+        return items
+
     async def get(self, item_id: str) -> Optional[T]:
         """Get an item by ID."""
         try:
@@ -55,6 +87,44 @@ class DynamoDBTable(BaseTable[T], Generic[T]):
         except ClientError:
             return None
 
+    async def get_many(self, item_ids: list[str]) -> dict[str, T]:
+        """Get several items by ID using BatchGetItem (100 keys per request).
+
+        Returns a dict mapping ID to item; IDs that do not exist are omitted.
+        """
+        items: dict[str, T] = {}
+        unique_ids = list(dict.fromkeys(item_ids))
+        if not unique_ids:
+            return items
+
+        dynamodb = await self._database.get_resource()
+        for start in range(0, len(unique_ids), BATCH_GET_MAX_KEYS):
+            request = {
+                self.table_name: {
+                    "Keys": [{"id": item_id} for item_id in unique_ids[start:start + BATCH_GET_MAX_KEYS]]
+                }
+            }
+            # Retry keys DynamoDB returns as unprocessed (throttling / size limits),
+            # backing off exponentially with full jitter as AWS recommends
+            attempt = 0
+            while True:
+                response = await dynamodb.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    items[item["id"]] = item
+                request = response.get("UnprocessedKeys")
+                if not request:
+                    break
+                if attempt >= BATCH_GET_MAX_RETRIES:
+                    remaining = len(request.get(self.table_name, {}).get("Keys", []))
+                    raise RuntimeError(
+                        f"BatchGetItem on {self.table_name}: {remaining} keys still "
+                        f"unprocessed after {BATCH_GET_MAX_RETRIES} retries"
+                    )
+                delay = min(BATCH_GET_MAX_DELAY_SECONDS, BATCH_GET_BASE_DELAY_SECONDS * 2 ** attempt)
+                await asyncio.sleep(random.uniform(0, delay))
+                attempt += 1
+        return items
+
     async def list(self, user_id: Optional[str] = None) -> list[T]:
         """List all items, optionally filtered by user_id."""
         table = await self._get_table()
@@ -79,6 +149,29 @@ class DynamoDBTable(BaseTable[T], Generic[T]):
             response = await table.scan()
             return response.get("Items", [])
 
+    async def find_by(self, attribute: str, value) -> list[T]:
+        """List items whose attribute equals the given value.
+
+        The predicate is evaluated server-side, so only matching items are
+        returned over the wire. Pages through the whole table because a
+        filtered page may be empty while more items remain.
+        """
+        table = await self._get_table()
+        scan_kwargs = {
+            "FilterExpression": "#attr = :val",
+            "ExpressionAttributeNames": {"#attr": attribute},
+            "ExpressionAttributeValues": {":val": value},
+        }
+
+        items = []
+        while True:
+            response = await table.scan(**scan_kwargs)
+            items.extend(response.get("Items", []))
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return items
+            scan_kwargs["ExclusiveStartKey"] = last_key
+
     async def delete(self, item_id: str) -> bool:
         """Delete an item by ID."""
         try:
@@ -93,6 +186,22 @@ class DynamoDBTable(BaseTable[T], Generic[T]):
                 return False
             raise
 
+    async def delete_many(self, item_ids: list[str]) -> int:
+        """Delete several items by ID using batched writes (25 items per request).
+
+        Batched deletes are unconditional, so the count is the number of
+        unique IDs requested rather than the number that existed.
+        """
+        unique_ids = list(dict.fromkeys(item_ids))
+        if not unique_ids:
+            return 0
+
+        table = await self._get_table()
+        async with table.batch_writer() as batch:
+            for item_id in unique_ids:
+                await batch.delete_item(Key={"id": item_id})
+        return len(unique_ids)
+
     async def update(self, item_id: str, updates: dict) -> Optional[T]:
         """Update an item."""
         if not updates:
@@ -100,19 +209,10 @@ class DynamoDBTable(BaseTable[T], Generic[T]):
 
         updates["updated_at"] = datetime.now().isoformat()
 
-        # Build update expression
-        update_expression_parts = []
-        expression_attribute_names = {}
-        expression_attribute_values = {}
-
-        for i, (key, value) in enumerate(updates.items()):
-            attr_name = f"#attr{i}"
-            attr_value = f":val{i}"
-            update_expression_parts.append(f"{attr_name} = {attr_value}")
-            expression_attribute_names[attr_name] = key
-            expression_attribute_values[attr_value] = value
-
-        update_expression = "SET " + ", ".join(update_expression_parts)
+        # Build update expression (the SET clause only depends on the field count)
+        update_expression, attr_names, attr_values = _update_expression(len(updates))
+        expression_attribute_names = dict(zip(attr_names, updates.keys()))
+        expression_attribute_values = dict(zip(attr_values, updates.values()))
 
         try:
             table = await self._get_table()
@@ -130,6 +230,33 @@ class DynamoDBTable(BaseTable[T], Generic[T]):
                 return None
             raise
 
+    async def patch(self, item_id: str, changes: dict) -> T:
+        """Set the given attributes on an item, creating it if missing.
+
+        Unlike update(), this is an upsert: a single UpdateItem without a
+        read, so only the changed attributes cross the wire.
+        """
+        now = datetime.now().isoformat()
+        changes = {key: value for key, value in changes.items() if key != "id"}
+        changes["updated_at"] = now
+
+        update_expression, attr_names, attr_values = _update_expression(len(changes))
+        expression_attribute_names = dict(zip(attr_names, changes.keys()))
+        expression_attribute_values = dict(zip(attr_values, changes.values()))
+        # Keep the original created_at once the item exists
+        expression_attribute_names["#created_at"] = "created_at"
+        expression_attribute_values[":created_at"] = now
+
+        table = await self._get_table()
+        response = await table.update_item(
+            Key={"id": item_id},
+            UpdateExpression=update_expression + ", #created_at = if_not_exists(#created_at, :created_at)",
+            ExpressionAttributeNames=expression_attribute_names,
+            ExpressionAttributeValues=expression_attribute_values,
+            ReturnValues="ALL_NEW"
+        )
+        return response["Attributes"]
+
 
 class DynamoDBMessagesTable(DynamoDBTable[T], Generic[T]):
     """Specialized DynamoDB table for messages with session_id querying support and TTL."""
@@ -139,18 +266,16 @@ class DynamoDBMessagesTable(DynamoDBTable[T], Generic[T]):
 
     async def put(self, item: T) -> T:
         """Insert or update a message with TTL expiration (7 days)."""
-        if "id" not in item:
-            item["id"] = str(uuid4())
-        if "created_at" not in item:
-            item["created_at"] = datetime.now().isoformat()
-        item["updated_at"] = datetime.now().isoformat()
-
         # Set TTL: expires 7 days from now (Unix epoch timestamp in seconds)
         item["expires_at"] = int(time.time()) + self.TTL_SECONDS
+        return await super().put(item)
 
-        table = await self._get_table()
-        await table.put_item(Item=item)
-        return item
+    async def put_many(self, items: list[T]) -> list[T]:
+        """Insert or update several messages in batched writes, each with the 7-day TTL."""
+        expires_at = int(time.time()) + self.TTL_SECONDS
+        for item in items:
+            item["expires_at"] = expires_at
+        return await super().put_many(items)
 
     async def list_by_session(self, session_id: str) -> list[T]:
         """List all messages for a session, ordered by timestamp."""
@@ -178,11 +303,7 @@ class DynamoDBMessagesTable(DynamoDBTable[T], Generic[T]):
     async def delete_by_session(self, session_id: str) -> int:
         """Delete all messages for a session. Returns count of deleted items."""
         messages = await self.list_by_session(session_id)
-        deleted_count = 0
-        for msg in messages:
-            if await self.delete(msg["id"]):
-                deleted_count += 1
-        return deleted_count
+        return await self.delete_many([msg["id"] for msg in messages])
 
 
 class DynamoDBSkillVersionsTable(DynamoDBTable[T], Generic[T]):
@@ -211,16 +332,74 @@ class DynamoDBSkillVersionsTable(DynamoDBTable[T], Generic[T]):
             items = response.get("Items", [])
             return sorted(items, key=lambda x: x.get("version", 0), reverse=True)
 
+    async def get_latest(self, skill_id: str) -> Optional[T]:
+        """Get the highest-numbered version of a skill."""
+        table = await self._get_table()
+
+        try:
+            # Newest-first on the version sort key; only one item is read
+            response = await table.query(
+                IndexName="skill_id-index",
+                KeyConditionExpression="skill_id = :sid",
+                ExpressionAttributeValues={":sid": skill_id},
+                ScanIndexForward=False,
+                Limit=1
+            )
+            items = response.get("Items", [])
+            return items[0] if items else None
+        except ClientError:
+            # Fall back to scan (every page) if GSI doesn't exist
+            items = await self.find_by("skill_id", skill_id)
+            return max(items, key=lambda x: x.get("version", 0), default=None)
+
+    async def count_by_skill(self, skill_id: str) -> int:
+        """Count the versions of a skill without transferring the items.
+
+        Each response's Count covers at most 1 MB of evaluated data, so the
+        result is summed over every page.
+        """
+        table = await self._get_table()
+
+        try:
+            return await self._count_pages(
+                table.query,
+                IndexName="skill_id-index",
+                KeyConditionExpression="skill_id = :sid",
+                ExpressionAttributeValues={":sid": skill_id},
+                Select="COUNT"
+            )
+        except ClientError:
+            # Fall back to scan with filter if GSI doesn't exist
+            return await self._count_pages(
+                table.scan,
+                FilterExpression="skill_id = :sid",
+                ExpressionAttributeValues={":sid": skill_id},
+                Select="COUNT"
+            )
+
+    @staticmethod
+    async def _count_pages(operation, **kwargs) -> int:
+        """Sum Count over every page of a Select=COUNT query or scan."""
+        count = 0
+        while True:
+            response = await operation(**kwargs)
+            count += response.get("Count", 0)
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                return count
+            kwargs["ExclusiveStartKey"] = last_key
+
     async def get_by_skill_and_version(self, skill_id: str, version: int) -> Optional[T]:
         """Get a specific version of a skill."""
         table = await self._get_table()
 
+        # "version" is a DynamoDB reserved word, so it must go through a name placeholder
         try:
-            # Try using GSI
+            # Try using GSI (version is its sort key)
             response = await table.query(
                 IndexName="skill_id-index",
-                KeyConditionExpression="skill_id = :sid",
-                FilterExpression="version = :ver",
+                KeyConditionExpression="skill_id = :sid AND #ver = :ver",
+                ExpressionAttributeNames={"#ver": "version"},
                 ExpressionAttributeValues={":sid": skill_id, ":ver": version}
             )
             items = response.get("Items", [])
@@ -228,7 +407,8 @@ class DynamoDBSkillVersionsTable(DynamoDBTable[T], Generic[T]):
         except ClientError:
             # Fall back to scan
             response = await table.scan(
-                FilterExpression="skill_id = :sid AND version = :ver",
+                FilterExpression="skill_id = :sid AND #ver = :ver",
+                ExpressionAttributeNames={"#ver": "version"},
                 ExpressionAttributeValues={":sid": skill_id, ":ver": version}
             )
             items = response.get("Items", [])
@@ -237,11 +417,7 @@ class DynamoDBSkillVersionsTable(DynamoDBTable[T], Generic[T]):
     async def delete_by_skill(self, skill_id: str) -> int:
         """Delete all versions for a skill. Returns count of deleted items."""
         versions = await self.list_by_skill(skill_id)
-        deleted_count = 0
-        for ver in versions:
-            if await self.delete(ver["id"]):
-                deleted_count += 1
-        return deleted_count
+        return await self.delete_many([ver["id"] for ver in versions])
 
 
 class DynamoDBDatabase(BaseDatabase):
@@ -249,15 +425,55 @@ class DynamoDBDatabase(BaseDatabase):
 
     def __init__(self):
         self._session = aioboto3.Session()
-        self._agents = DynamoDBTable[dict](settings.dynamodb_agents_table, self._session)
-        self._skills = DynamoDBTable[dict](settings.dynamodb_skills_table, self._session)
-        self._mcp_servers = DynamoDBTable[dict](settings.dynamodb_mcp_table, self._session)
-        self._sessions = DynamoDBTable[dict](settings.dynamodb_sessions_table, self._session)
-        self._messages = DynamoDBMessagesTable[dict](settings.dynamodb_messages_table, self._session)
-        self._users = DynamoDBTable[dict](settings.dynamodb_users_table, self._session)
-        self._skill_versions = DynamoDBSkillVersionsTable[dict](settings.dynamodb_skill_versions_table, self._session)
-        self._settings = DynamoDBTable[dict](settings.dynamodb_settings_table, self._session)
-        self._plugins = DynamoDBTable[dict](settings.dynamodb_plugins_table, self._session)
+        # One long-lived service resource (and its HTTP connection pool) shared by all tables
+        self._resource = None
+        self._resource_stack: AsyncExitStack | None = None
+        self._resource_lock = asyncio.Lock()
+        self._tables: dict = {}
+
+        self._agents = DynamoDBTable[dict](settings.dynamodb_agents_table, self)
+        self._skills = DynamoDBTable[dict](settings.dynamodb_skills_table, self)
+        self._mcp_servers = DynamoDBTable[dict](settings.dynamodb_mcp_table, self)
+        self._sessions = DynamoDBTable[dict](settings.dynamodb_sessions_table, self)
+        self._messages = DynamoDBMessagesTable[dict](settings.dynamodb_messages_table, self)
+        self._users = DynamoDBTable[dict](settings.dynamodb_users_table, self)
+        self._skill_versions = DynamoDBSkillVersionsTable[dict](settings.dynamodb_skill_versions_table, self)
+        self._settings = DynamoDBTable[dict](settings.dynamodb_settings_table, self)
+        self._plugins = DynamoDBTable[dict](settings.dynamodb_plugins_table, self)
+
+    async def get_resource(self):
+        """Get the shared DynamoDB service resource, opening it on first use."""
+        if self._resource is None:
+            async with self._resource_lock:
+                if self._resource is None:
+                    kwargs = {"region_name": settings.aws_region}
+                    if settings.aws_access_key_id:
+                        kwargs["aws_access_key_id"] = settings.aws_access_key_id
+                        kwargs["aws_secret_access_key"] = settings.aws_secret_access_key
+
+                    stack = AsyncExitStack()
+                    self._resource = await stack.enter_async_context(
+                        self._session.resource("dynamodb", **kwargs)
+                    )
+                    self._resource_stack = stack
+        return self._resource
+
+    async def get_table(self, table_name: str):
+        """Get a cached Table resource on the shared connection."""
+        table = self._tables.get(table_name)
+        if table is None:
+            dynamodb = await self.get_resource()
+            table = await dynamodb.Table(table_name)
+            self._tables[table_name] = table
+        return table
+
+    async def close(self) -> None:
+        """Close the shared DynamoDB connection."""
+        if self._resource_stack is not None:
+            await self._resource_stack.aclose()
+        self._resource_stack = None
+        self._resource = None
+        self._tables.clear()
 
     @property
     def agents(self) -> DynamoDBTable:
@@ -3,11 +3,15 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
+import anyio.to_thread
+import asyncio
 import logging
 
 from config import settings
+from database import db
 from routers import agents_router, skills_router, mcp_router, chat_router, auth_router, workspace_router, settings_router, plugins_router
 from middleware.error_handler import setup_error_handlers
 from middleware.rate_limit import limiter
@@ -36,9 +40,21 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Debug mode: {settings.debug}")
     logger.info(f"Rate limit: {settings.rate_limit_per_minute}/minute")
+
+    # Size the default executor for I/O-bound work (S3 uploads/downloads run
+    # through asyncio.to_thread) instead of the CPU-derived default
+    executor = ThreadPoolExecutor(
+        max_workers=settings.thread_pool_size,
+        thread_name_prefix="agent-platform-io",
+    )
+    asyncio.get_running_loop().set_default_executor(executor)
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.thread_pool_size
+    logger.info(f"Thread pool size: {settings.thread_pool_size}")
     yield
     # Shutdown
     logger.info("Shutting down...")
+    await db.close()
+    executor.shutdown(wait=False)
 
 
 # Create FastAPI application
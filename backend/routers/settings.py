@@ -1,9 +1,10 @@
 """Settings API endpoints for managing runtime configuration."""
 import logging
-from datetime import datetime
+import time
 from fastapi import APIRouter
-from schemas.settings import SettingsUpdateRequest, SettingsResponse
+from schemas.settings import SettingsUpdateRequest, SettingsResponse, SettingsFlagsResponse
 from database import db
+from core.secrets_store import secrets_store
 from config import settings as env_settings
 
 logger = logging.getLogger(__name__)
@@ -12,9 +13,69 @@ router = APIRouter()
 # Global settings record ID (single record for the entire application)
 SETTINGS_ID = "global"
 
-# In-memory cache for sensitive values (cleared on restart)
-# These are stored separately from the database for security
-_secrets_cache: dict[str, str] = {}
+# Environment fallbacks for the get_runtime_* helpers (fixed for the life
+# of the process, so read from env_settings once)
+_ENV_API_KEY = env_settings.anthropic_api_key
+_ENV_AWS_ACCESS_KEY_ID = env_settings.aws_access_key_id
+_ENV_AWS_SECRET_ACCESS_KEY = env_settings.aws_secret_access_key
+_ENV_AWS_SESSION_TOKEN = env_settings.aws_session_token or None
+_ENV_BEARER_TOKEN = env_settings.aws_bearer_token_bedrock or None
+
+# Process-local copy of the stored settings record, refreshed after
+# SETTINGS_CACHE_TTL_SECONDS so writes from other workers show up
+SETTINGS_CACHE_TTL_SECONDS = 5.0
+_settings_cache: dict | None = None
+_settings_cache_ts: float = 0.0
+
+
+def _empty_to_none(value: str) -> str | None:
+    """Store an empty string from the UI as a cleared (None) value."""
+    return value or None
+
+
+# Plain request fields persisted as-is, with an optional transform
+_PLAIN_FIELDS = {
+    "anthropic_base_url": _empty_to_none,
+    "claude_code_use_bedrock": None,
+    "bedrock_auth_method": None,
+    "aws_region": None,
+    "aws_access_key_id": _empty_to_none,
+}
+
+# Write-only request fields and the *_set flag persisted for each
+_SENSITIVE_FIELDS = {
+    "anthropic_api_key": "anthropic_api_key_set",
+    "aws_secret_access_key": "aws_secret_access_key_set",
+    "aws_session_token": "aws_session_token_set",
+    "aws_bearer_token": "aws_bearer_token_set",
+}
+
+# Stored-record field defaults, i.e. the SettingsResponse field defaults
+_STORED_DEFAULTS = {name: field.default for name, field in SettingsResponse.model_fields.items()}
+
+
+def _response_from_record(stored: dict) -> SettingsResponse:
+    """Build the masked settings response from a stored settings record.
+
+    The record is written only by update_settings from validated input, so
+    the response is constructed without re-running validation.
+    """
+    return SettingsResponse.model_construct(**{**_STORED_DEFAULTS, **stored})
+
+
+# Response used until settings are first saved; env values are fixed for
+# the life of the process, so it is built once
+_ENV_DEFAULT_RESPONSE = SettingsResponse(
+    anthropic_base_url=env_settings.anthropic_base_url,
+    anthropic_api_key_set=bool(env_settings.anthropic_api_key),
+    claude_code_use_bedrock=env_settings.claude_code_use_bedrock,
+    bedrock_auth_method="credentials",  # Default
+    aws_region=env_settings.aws_region,
+    aws_access_key_id=env_settings.aws_access_key_id or None,
+    aws_secret_access_key_set=bool(env_settings.aws_secret_access_key),
+    aws_session_token_set=bool(env_settings.aws_session_token),
+    aws_bearer_token_set=bool(env_settings.aws_bearer_token_bedrock),
+)
 
 
 @router.get("", response_model=SettingsResponse)
@@ -23,121 +84,98 @@ async def get_settings():
 
     Returns settings with sensitive fields masked (only showing *_set booleans).
     """
+    global _settings_cache, _settings_cache_ts
+
+    if _settings_cache is not None and time.monotonic() - _settings_cache_ts < SETTINGS_CACHE_TTL_SECONDS:
+        return _response_from_record(_settings_cache)
+
     stored = await db.settings.get(SETTINGS_ID)
 
     if not stored:
         # Return defaults from environment variables
-        return SettingsResponse(
-            anthropic_base_url=env_settings.anthropic_base_url,
-            anthropic_api_key_set=bool(env_settings.anthropic_api_key),
-            claude_code_use_bedrock=env_settings.claude_code_use_bedrock,
-            bedrock_auth_method="credentials",  # Default
-            aws_region=env_settings.aws_region,
-            aws_access_key_id=env_settings.aws_access_key_id or None,
-            aws_secret_access_key_set=bool(env_settings.aws_secret_access_key),
-            aws_session_token_set=bool(env_settings.aws_session_token),
-            aws_bearer_token_set=bool(env_settings.aws_bearer_token_bedrock),
-        )
-
-    return SettingsResponse(
-        anthropic_base_url=stored.get("anthropic_base_url"),
-        anthropic_api_key_set=stored.get("anthropic_api_key_set", False),
-        claude_code_use_bedrock=stored.get("claude_code_use_bedrock", False),
-        bedrock_auth_method=stored.get("bedrock_auth_method", "credentials"),
-        aws_region=stored.get("aws_region", "us-west-2"),
-        aws_access_key_id=stored.get("aws_access_key_id"),
-        aws_secret_access_key_set=stored.get("aws_secret_access_key_set", False),
-        aws_session_token_set=stored.get("aws_session_token_set", False),
-        aws_bearer_token_set=stored.get("aws_bearer_token_set", False),
-        updated_at=stored.get("updated_at"),
-    )
+        return _ENV_DEFAULT_RESPONSE
+
+    _settings_cache = stored
+    _settings_cache_ts = time.monotonic()
+    return _response_from_record(stored)
+
+
+@router.get("/flags", response_model=SettingsFlagsResponse)
+async def get_settings_flags():
+    """Get which write-only credentials this process can use.
+
+    Answered from the secrets store and environment only (no database read),
+    so this is the preferred endpoint for polling credential status.
+    """
+    return SettingsFlagsResponse.model_construct(**{
+        set_flag: secrets_store.has(name) or getattr(_ENV_DEFAULT_RESPONSE, set_flag)
+        for name, set_flag in _SENSITIVE_FIELDS.items()
+    })
 
 
 @router.put("", response_model=SettingsResponse)
 async def update_settings(request: SettingsUpdateRequest):
     """Update runtime settings.
 
-    Sensitive fields (API keys, secrets, tokens) are cached in-memory
-    and only their presence is stored in the database (*_set booleans).
+    Sensitive fields (API keys, secrets, tokens) are kept in the secrets
+    store and only their presence is stored in the database (*_set booleans).
     """
-    updates: dict = {
-        "id": SETTINGS_ID,
-        "updated_at": datetime.now().isoformat(),
-    }
+    global _settings_cache, _settings_cache_ts
+
+    # Only visit the fields the client actually sent
+    changes = request.changed()
+    if not changes:
+        # Every field omitted or null: nothing to write
+        return await get_settings()
+
+    updates: dict = {}
 
     # Handle non-sensitive fields
-    if request.anthropic_base_url is not None:
-        updates["anthropic_base_url"] = request.anthropic_base_url or None
-    if request.claude_code_use_bedrock is not None:
-        updates["claude_code_use_bedrock"] = request.claude_code_use_bedrock
-    if request.bedrock_auth_method is not None:
-        updates["bedrock_auth_method"] = request.bedrock_auth_method
-    if request.aws_region is not None:
-        updates["aws_region"] = request.aws_region
-    if request.aws_access_key_id is not None:
-        updates["aws_access_key_id"] = request.aws_access_key_id or None
-
-    # Handle sensitive fields (store indicator, cache actual value)
-    if request.anthropic_api_key is not None:
-        updates["anthropic_api_key_set"] = bool(request.anthropic_api_key)
-        if request.anthropic_api_key:
-            _secrets_cache["anthropic_api_key"] = request.anthropic_api_key
-        elif "anthropic_api_key" in _secrets_cache:
-            del _secrets_cache["anthropic_api_key"]
-
-    if request.aws_secret_access_key is not None:
-        updates["aws_secret_access_key_set"] = bool(request.aws_secret_access_key)
-        if request.aws_secret_access_key:
-            _secrets_cache["aws_secret_access_key"] = request.aws_secret_access_key
-        elif "aws_secret_access_key" in _secrets_cache:
-            del _secrets_cache["aws_secret_access_key"]
-
-    if request.aws_session_token is not None:
-        updates["aws_session_token_set"] = bool(request.aws_session_token)
-        if request.aws_session_token:
-            _secrets_cache["aws_session_token"] = request.aws_session_token
-        elif "aws_session_token" in _secrets_cache:
-            del _secrets_cache["aws_session_token"]
-
-    if request.aws_bearer_token is not None:
-        updates["aws_bearer_token_set"] = bool(request.aws_bearer_token)
-        if request.aws_bearer_token:
-            _secrets_cache["aws_bearer_token"] = request.aws_bearer_token
-        elif "aws_bearer_token" in _secrets_cache:
-            del _secrets_cache["aws_bearer_token"]
-
-    # Merge with existing settings
-    existing = await db.settings.get(SETTINGS_ID) or {}
-    merged = {**existing, **updates}
-
-    await db.settings.put(merged)
+    for name in changes.keys() & _PLAIN_FIELDS.keys():
+        transform = _PLAIN_FIELDS[name]
+        updates[name] = transform(changes[name]) if transform else changes[name]
+
+    # Handle sensitive fields (store indicator, keep actual value in the secrets store)
+    secret_changes = {name: changes[name] for name in changes.keys() & _SENSITIVE_FIELDS.keys()}
+    updates.update({_SENSITIVE_FIELDS[name]: bool(value) for name, value in secret_changes.items()})
+    for name, value in secret_changes.items():
+        if value:
+            secrets_store.set(name, value)
+        else:
+            secrets_store.delete(name)
+
+    # Upsert only the changed attributes (updated_at is stamped by patch)
+    stored = await db.settings.patch(SETTINGS_ID, updates)
+    _settings_cache = stored
+    _settings_cache_ts = time.monotonic()
     logger.info("Settings updated successfully")
 
-    return await get_settings()
+    return _response_from_record(stored)
 
 
 # Helper functions for other modules to access runtime credentials
 
 def get_runtime_api_key() -> str | None:
-    """Get API key from cache or environment."""
-    return _secrets_cache.get("anthropic_api_key") or env_settings.anthropic_api_key
+    """Get API key from the secrets store or environment."""
+    return secrets_store.get("anthropic_api_key") or _ENV_API_KEY
 
 
 def get_runtime_aws_credentials() -> dict:
-    """Get AWS credentials from cache or environment.
+    """Get AWS credentials from the secrets store or environment.
 
     Returns dict with:
     - aws_access_key_id
     - aws_secret_access_key
     - aws_session_token (optional)
     """
+    get_secret = secrets_store.get
     return {
-        "aws_access_key_id": _secrets_cache.get("aws_access_key_id") or env_settings.aws_access_key_id,
-        "aws_secret_access_key": _secrets_cache.get("aws_secret_access_key") or env_settings.aws_secret_access_key,
-        "aws_session_token": _secrets_cache.get("aws_session_token") or env_settings.aws_session_token or None,
+        "aws_access_key_id": get_secret("aws_access_key_id") or _ENV_AWS_ACCESS_KEY_ID,
+        "aws_secret_access_key": get_secret("aws_secret_access_key") or _ENV_AWS_SECRET_ACCESS_KEY,
+        "aws_session_token": get_secret("aws_session_token") or _ENV_AWS_SESSION_TOKEN,
     }
 
 
 def get_runtime_bearer_token() -> str | None:
-    """Get AWS Bedrock Bearer Token from cache or environment."""
-    return _secrets_cache.get("aws_bearer_token") or env_settings.aws_bearer_token_bedrock or None
+    """Get AWS Bedrock Bearer Token from the secrets store or environment."""
+    return secrets_store.get("aws_bearer_token") or _ENV_BEARER_TOKEN
@@ -19,6 +19,7 @@ from schemas.skill import (
 from database import db
 from core.skill_manager import skill_manager
 from core.agent_manager import agent_manager
+from core.workspace_manager import workspace_manager
 from core.exceptions import (
     SkillNotFoundException,
     ValidationException,
@@ -94,6 +95,7 @@ async def upload_skill(
             skill_name=skill_name,
             original_filename=file.filename
         )
+        workspace_manager.invalidate_skill_cache()
 
         # Check if skill already exists (by looking for matching s3_location pattern)
         existing_skills = await db.skills.list()
@@ -163,6 +165,7 @@ async def refresh_skills():
 
         # Run synchronization
         sync_result, skills_to_add = await skill_manager.refresh(db_skills)
+        workspace_manager.invalidate_skill_cache()
 
         # Add new skills to database
         for skill_data in skills_to_add:
@@ -388,6 +391,8 @@ async def finalize_skill(request: SkillFinalizeRequest):
             detail=f"Skill directory exists but missing SKILL.md at: {skill_md_path}",
             suggested_action="Ensure the agent created a valid SKILL.md file"
         )
+    # The agent wrote SKILL.md inside a folder it had already created
+    workspace_manager.invalidate_skill_cache()
 
     try:
         # Extract metadata from SKILL.md
@@ -572,6 +577,7 @@ async def publish_skill_draft(skill_id: str, request: PublishDraftRequest | None
 
         # Download to local workspace (local always reflects published version)
         await skill_manager.download_version_to_local(skill_folder_name, new_version)
+        workspace_manager.invalidate_skill_cache()
 
         logger.info(f"Published skill {skill_id} as v{new_version}")
         return updated_skill
@@ -674,6 +680,7 @@ async def rollback_skill_version(skill_id: str, request: RollbackRequest):
 
         # Download target version to local workspace
         await skill_manager.download_version_to_local(skill_folder_name, target_version)
+        workspace_manager.invalidate_skill_cache()
 
         logger.info(f"Rolled back skill {skill_id} to v{target_version}")
         return updated_skill
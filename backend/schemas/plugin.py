@@ -25,6 +25,7 @@ class PluginResponse(BaseModel):
     description: str
     git_url: str
     git_ref: str
+    git_sha: str | None = Field(default=None, description="Commit SHA the plugin was installed from")
     version: str
     author: str
     created_at: str
@@ -25,6 +25,18 @@ class SettingsUpdateRequest(BaseModel):
     # Bearer Token auth (Option B)
     aws_bearer_token: str | None = None  # Write-only
 
+    def changed(self) -> dict:
+        """Get the fields the client sent with a value.
+
+        Omitted fields and explicit nulls both mean "leave unchanged".
+        """
+        changes = {}
+        for name in self.model_fields_set:
+            value = getattr(self, name)
+            if value is not None:
+                changes[name] = value
+        return changes
+
 
 class SettingsResponse(BaseModel):
     """Response model for settings (sensitive fields masked)."""
@@ -50,3 +62,12 @@ class SettingsResponse(BaseModel):
 
     # Metadata
     updated_at: str | None = None
+
+
+class SettingsFlagsResponse(BaseModel):
+    """Which write-only credentials are available to this process."""
+
+    anthropic_api_key_set: bool = False
+    aws_secret_access_key_set: bool = False
+    aws_session_token_set: bool = False
+    aws_bearer_token_set: bool = False
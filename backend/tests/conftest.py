@@ -32,22 +32,27 @@ async def async_client() -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
 
+# In-memory tables snapshotted by reset_database, when the backend has them
+_IN_MEMORY_TABLES = ("_agents", "_skills", "_mcp_servers", "_sessions")
+
+
 @pytest.fixture(autouse=True)
 def reset_database():
-    """Reset database before each test."""
+    """Reset database before each test.
+
+    Only in-memory tables (with a _data dict) can be restored; the DynamoDB
+    backend holds no local rows, so there is nothing to reset for it.
+    """
     # Store original data
-    original_agents = dict(db._agents._data)
-    original_skills = dict(db._skills._data)
-    original_mcp_servers = dict(db._mcp_servers._data)
-    original_sessions = dict(db._sessions._data)
+    tables = [getattr(db, name, None) for name in _IN_MEMORY_TABLES]
+    tables = [table for table in tables if hasattr(table, "_data")]
+    originals = [dict(table._data) for table in tables]
 
     yield
 
     # Restore original data after test
-    db._agents._data = original_agents
-    db._skills._data = original_skills
-    db._mcp_servers._data = original_mcp_servers
-    db._sessions._data = original_sessions
+    for table, original in zip(tables, originals):
+        table._data = original
 
 
 # Sample test data fixtures
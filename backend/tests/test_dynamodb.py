@@ -0,0 +1,210 @@
+"""Tests for DynamoDB table operations."""
+import re
+
+import pytest
+from botocore.exceptions import ClientError
+
+import database.dynamodb as dynamodb_module
+from database.dynamodb import DynamoDBTable, DynamoDBSkillVersionsTable, BATCH_GET_MAX_RETRIES
+
+# "#name = :value" or "#name = if_not_exists(#name, :value)" in a SET expression
+_SET_ASSIGNMENT_RE = re.compile(r"(#\w+) = (?:if_not_exists\(#\w+, (:\w+)\)|(:\w+))")
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(dynamodb_module.asyncio, "sleep", sleep)
+    return delays
+
+
+class FakeResource:
+    """BatchGetItem stub that leaves keys unprocessed for the first N calls."""
+
+    def __init__(self, table_name: str, unprocessed_calls: int):
+        self.table_name = table_name
+        self.unprocessed_calls = unprocessed_calls
+        self.calls = 0
+
+    async def batch_get_item(self, RequestItems):
+        self.calls += 1
+        keys = RequestItems[self.table_name]["Keys"]
+        if self.calls <= self.unprocessed_calls:
+            return {"Responses": {}, "UnprocessedKeys": RequestItems}
+        return {"Responses": {self.table_name: [dict(key) for key in keys]}}
+
+
+class FakeTable:
+    """Query/scan stub that serves items in pages of page_size.
+
+    With has_index=False, queries on a GSI fail the way DynamoDB does when
+    the index does not exist.
+    """
+
+    def __init__(self, items: list[dict], page_size: int = 2, has_index: bool = True):
+        self.items = items
+        self.page_size = page_size
+        self.has_index = has_index
+        self.calls = []
+
+    def _page(self, matches: list[dict], kwargs: dict) -> dict:
+        start = kwargs.get("ExclusiveStartKey", {}).get("offset", 0)
+        page = matches[start:start + self.page_size]
+        response = {"Count": len(page)}
+        if kwargs.get("Select") != "COUNT":
+            response["Items"] = page
+        if start + self.page_size < len(matches):
+            response["LastEvaluatedKey"] = {"offset": start + self.page_size}
+        return response
+
+    async def query(self, **kwargs):
+        self.calls.append("query")
+        if not self.has_index:
+            raise ClientError({"Error": {"Code": "ValidationException"}}, "Query")
+        skill_id = kwargs["ExpressionAttributeValues"][":sid"]
+        matches = sorted(
+            (item for item in self.items if item["skill_id"] == skill_id),
+            key=lambda item: item["version"],
+            reverse=not kwargs.get("ScanIndexForward", True),
+        )
+        if "Limit" in kwargs:
+            matches = matches[:kwargs["Limit"]]
+        return self._page(matches, kwargs)
+
+    async def scan(self, **kwargs):
+        self.calls.append("scan")
+        values = kwargs["ExpressionAttributeValues"]
+        skill_id = values.get(":sid", values.get(":val"))
+        return self._page([item for item in self.items if item["skill_id"] == skill_id], kwargs)
+
+
+class FakeUpdateTable:
+    """UpdateItem stub applying the SET expressions DynamoDBTable.patch builds."""
+
+    def __init__(self):
+        self.items: dict[str, dict] = {}
+        self.calls = []
+
+    async def update_item(self, Key, UpdateExpression, ExpressionAttributeNames,
+                          ExpressionAttributeValues, ReturnValues):
+        self.calls.append(UpdateExpression)
+        assert ReturnValues == "ALL_NEW"
+        item = self.items.setdefault(Key["id"], dict(Key))
+        assert UpdateExpression.startswith("SET ")
+        for name, fallback, value in _SET_ASSIGNMENT_RE.findall(UpdateExpression):
+            attribute = ExpressionAttributeNames[name]
+            if fallback:
+                item.setdefault(attribute, ExpressionAttributeValues[fallback])
+            else:
+                item[attribute] = ExpressionAttributeValues[value]
+        return {"Attributes": dict(item)}
+
+
+class FakeDatabase:
+    def __init__(self, resource: FakeResource = None, table=None):
+        self.resource = resource
+        self.table = table
+
+    async def get_resource(self):
+        return self.resource
+
+    async def get_table(self, table_name: str):
+        return self.table
+
+
+class TestGetMany:
+    """Tests for DynamoDBTable.get_many."""
+
+    async def test_retries_unprocessed_keys_with_backoff(self, no_backoff_sleep):
+        """Test unprocessed keys are retried after growing backoff delays."""
+        resource = FakeResource("items", unprocessed_calls=3)
+        table = DynamoDBTable("items", FakeDatabase(resource))
+
+        items = await table.get_many(["a", "b", "a"])
+
+        assert set(items) == {"a", "b"}
+        assert resource.calls == 4
+        assert len(no_backoff_sleep) == 3
+
+    async def test_gives_up_after_retry_cap(self, no_backoff_sleep):
+        """Test get_many raises instead of retrying forever under throttling."""
+        resource = FakeResource("items", unprocessed_calls=BATCH_GET_MAX_RETRIES + 1)
+        table = DynamoDBTable("items", FakeDatabase(resource))
+
+        with pytest.raises(RuntimeError):
+            await table.get_many(["a"])
+        assert resource.calls == BATCH_GET_MAX_RETRIES + 1
+        assert len(no_backoff_sleep) == BATCH_GET_MAX_RETRIES
+
+
+class TestPatch:
+    """Tests for DynamoDBTable.patch."""
+
+    async def test_creates_missing_item(self):
+        """Test patch upserts an item that does not exist yet."""
+        fake = FakeUpdateTable()
+        table = DynamoDBTable("settings", FakeDatabase(table=fake))
+
+        item = await table.patch("global", {"aws_region": "eu-west-1"})
+
+        assert item["id"] == "global"
+        assert item["aws_region"] == "eu-west-1"
+        assert item["created_at"] == item["updated_at"]
+        assert len(fake.calls) == 1
+
+    async def test_updates_only_given_attributes(self):
+        """Test other attributes and created_at survive, while updated_at moves."""
+        fake = FakeUpdateTable()
+        table = DynamoDBTable("settings", FakeDatabase(table=fake))
+        first = await table.patch("global", {"aws_region": "eu-west-1", "anthropic_api_key_set": True})
+        fake.items["global"]["created_at"] = "2020-01-01T00:00:00"
+
+        item = await table.patch("global", {"aws_region": "us-east-1", "id": "other"})
+
+        assert item["id"] == "global"
+        assert item["aws_region"] == "us-east-1"
+        assert item["anthropic_api_key_set"] is True
+        assert item["created_at"] == "2020-01-01T00:00:00"
+        assert item["updated_at"] >= first["updated_at"]
+
+
+def _versions(skill_id: str, count: int) -> list[dict]:
+    return [{"id": f"{skill_id}-v{n}", "skill_id": skill_id, "version": n} for n in range(1, count + 1)]
+
+
+class TestSkillVersionQueries:
+    """Tests for DynamoDBSkillVersionsTable.get_latest and count_by_skill."""
+
+    ITEMS = _versions("skill-a", 5) + _versions("skill-b", 2)
+
+    @pytest.mark.parametrize("has_index", [True, False])
+    async def test_get_latest_returns_highest_version(self, has_index: bool):
+        """Test the newest version is found with or without skill_id-index."""
+        fake = FakeTable(self.ITEMS, has_index=has_index)
+        table = DynamoDBSkillVersionsTable("versions", FakeDatabase(table=fake))
+
+        latest = await table.get_latest("skill-a")
+
+        assert latest["version"] == 5
+        # The fallback scan has to read every page, not just the first
+        assert fake.calls.count("scan") == (0 if has_index else 3)
+
+    async def test_get_latest_without_versions(self):
+        """Test None is returned for a skill with no versions."""
+        table = DynamoDBSkillVersionsTable("versions", FakeDatabase(table=FakeTable(self.ITEMS)))
+
+        assert await table.get_latest("missing") is None
+
+    @pytest.mark.parametrize("has_index", [True, False])
+    async def test_count_by_skill_sums_every_page(self, has_index: bool):
+        """Test the count follows LastEvaluatedKey instead of stopping at the first page."""
+        fake = FakeTable(self.ITEMS, page_size=2, has_index=has_index)
+        table = DynamoDBSkillVersionsTable("versions", FakeDatabase(table=fake))
+
+        assert await table.count_by_skill("skill-a") == 5
+        assert fake.calls.count("query" if has_index else "scan") == 3
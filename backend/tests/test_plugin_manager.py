@@ -0,0 +1,307 @@
+"""Tests for plugin repository download, extraction and skill installs."""
+import asyncio
+import io
+import tarfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import core.plugin_manager as plugin_manager_module
+from core.plugin_manager import PluginManager, PluginMetadata
+
+
+def _write_archive(path: Path, members: list[tuple[tarfile.TarInfo, bytes]]) -> str:
+    """Write a .tar.gz with the given members and return its file:// URL."""
+    with tarfile.open(path, "w:gz") as tar:
+        for info, data in members:
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return path.as_uri()
+
+
+def _file(name: str, data: bytes = b"content") -> tuple[tarfile.TarInfo, bytes]:
+    return tarfile.TarInfo(name), data
+
+
+def _symlink(name: str, target: str) -> tuple[tarfile.TarInfo, bytes]:
+    info = tarfile.TarInfo(name)
+    info.type = tarfile.SYMTYPE
+    info.linkname = target
+    return info, b""
+
+
+class TestExtractArchive:
+    """Tests for PluginManager._extract_archive."""
+
+    def test_extracts_sparse_paths_only(self, tmp_path: Path):
+        """Test top-level files and PLUGIN_SPARSE_PATHS are kept, the rest skipped."""
+        url = _write_archive(tmp_path / "repo.tar.gz", [
+            _file("repo-main/plugin.yaml", b"name: demo\n"),
+            _file("repo-main/skills/demo/SKILL.md"),
+            _file("repo-main/docs/guide.md"),
+        ])
+        dest = tmp_path / "repo"
+
+        PluginManager()._extract_archive(url, dest)
+
+        assert (dest / "plugin.yaml").read_bytes() == b"name: demo\n"
+        assert (dest / "skills" / "demo" / "SKILL.md").is_file()
+        assert not (dest / "docs").exists()
+
+    def test_rejects_path_traversal(self, tmp_path: Path):
+        """Test a member escaping the destination is refused by the data filter."""
+        url = _write_archive(tmp_path / "repo.tar.gz", [
+            _file("repo-main/skills/../../escaped.txt"),
+        ])
+        dest = tmp_path / "out" / "repo"
+
+        with pytest.raises(tarfile.FilterError):
+            PluginManager()._extract_archive(url, dest)
+        assert not (tmp_path / "out" / "escaped.txt").exists()
+        assert not (tmp_path / "escaped.txt").exists()
+
+    def test_rejects_absolute_symlink(self, tmp_path: Path):
+        """Test a symlink pointing outside the destination is refused."""
+        url = _write_archive(tmp_path / "repo.tar.gz", [
+            _symlink("repo-main/skills/passwd", "/etc/passwd"),
+        ])
+        dest = tmp_path / "repo"
+
+        with pytest.raises(tarfile.FilterError):
+            PluginManager()._extract_archive(url, dest)
+        assert not (dest / "skills" / "passwd").is_symlink()
+
+
+class TestInstallFromArchive:
+    """Tests for the tarball path of PluginManager.install_from_git."""
+
+    async def test_archive_is_fetched_by_resolved_sha(self, monkeypatch):
+        """Test the SHA is resolved before download and the archive pinned to it."""
+        sha = "0123456789abcdef0123456789abcdef01234567"
+        manager = PluginManager()
+        calls = []
+
+        async def resolve_remote_sha(git_url, ref):
+            calls.append(("ls-remote", ref))
+            return sha
+
+        def extract_archive(archive_url, dest_dir):
+            calls.append(("download", archive_url))
+            dest_dir.mkdir(parents=True)
+
+        async def parse_plugin_yaml(repo_dir, git_url=""):
+            return PluginMetadata(name="demo", version="1.0.0", description="", author="", skills=[])
+
+        async def find_plugin_by_git_url(git_url):
+            return None
+
+        async def install_skills(repo_dir, metadata):
+            return []
+
+        async def put(item):
+            return item
+
+        monkeypatch.setattr(manager, "_resolve_remote_sha", resolve_remote_sha)
+        monkeypatch.setattr(manager, "_extract_archive", extract_archive)
+        monkeypatch.setattr(manager, "_parse_plugin_yaml", parse_plugin_yaml)
+        monkeypatch.setattr(manager, "_find_plugin_by_git_url", find_plugin_by_git_url)
+        monkeypatch.setattr(manager, "_install_skills", install_skills)
+        monkeypatch.setattr(plugin_manager_module, "db", SimpleNamespace(plugins=SimpleNamespace(put=put)))
+
+        plugin = await manager.install_from_git("https://github.com/org/demo.git", "main")
+
+        assert calls == [
+            ("ls-remote", "main"),
+            ("download", f"https://github.com/org/demo/archive/{sha}.tar.gz"),
+        ]
+        assert plugin["git_sha"] == sha
+        assert plugin["git_ref"] == "main"
+
+
+class FakeSkillManager:
+    """SkillManager stub recording S3 uploads, draft discards and deletes."""
+
+    def __init__(
+        self,
+        failing_uploads: tuple[str, ...] = (),
+        failing_deletes: tuple[str, ...] = (),
+        upload_delays: dict | None = None,
+    ):
+        self.failing_uploads = failing_uploads
+        self.failing_deletes = failing_deletes
+        self.upload_delays = upload_delays or {}
+        self.uploaded: list[str] = []
+        self.discarded: list[str] = []
+        self.deleted: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    def extract_skill_metadata(self, skill_dir: Path):
+        return SimpleNamespace(name=skill_dir.name, description="", version="1.0.0", author="")
+
+    async def upload_to_draft(self, skill_name: str, skill_dir: Path) -> str:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.upload_delays.get(skill_name, 0))
+            if skill_name in self.failing_uploads:
+                raise RuntimeError(f"upload of {skill_name} failed")
+            self.uploaded.append(skill_name)
+            return f"s3://bucket/skills/{skill_name}/draft/"
+        finally:
+            self.active -= 1
+
+    async def discard_draft(self, skill_name: str) -> int:
+        self.discarded.append(skill_name)
+        return 1
+
+    async def delete_skill_files(self, skill_name: str) -> None:
+        if skill_name in self.failing_deletes:
+            raise RuntimeError(f"S3 delete of {skill_name} failed")
+        self.deleted.append(skill_name)
+
+
+class FakeSkillsTable:
+    """Skills table stub whose batch writes, single writes and deletes can be made to fail."""
+
+    def __init__(
+        self,
+        fail_batch: bool = False,
+        failing_puts: tuple[str, ...] = (),
+        failing_deletes: tuple[str, ...] = (),
+    ):
+        self.fail_batch = fail_batch
+        self.failing_puts = failing_puts
+        self.failing_deletes = failing_deletes
+        self.items: dict[str, dict] = {}
+        self.batches: list[list[str]] = []
+
+    def _stamp(self, item: dict) -> dict:
+        item.setdefault("id", f"id-{item['name']}")
+        self.items[item["id"]] = item
+        return item
+
+    async def put_many(self, items: list[dict]) -> list[dict]:
+        self.batches.append([item["name"] for item in items])
+        if self.fail_batch:
+            raise RuntimeError("BatchWriteItem failed")
+        return [self._stamp(item) for item in items]
+
+    async def put(self, item: dict) -> dict:
+        if item["name"] in self.failing_puts:
+            raise RuntimeError(f"PutItem for {item['name']} failed")
+        return self._stamp(item)
+
+    async def get(self, item_id: str):
+        return self.items.get(item_id)
+
+    async def delete(self, item_id: str) -> bool:
+        if item_id in self.failing_deletes:
+            raise RuntimeError(f"DeleteItem for {item_id} failed")
+        return self.items.pop(item_id, None) is not None
+
+
+def _skills_repo(root: Path, names: list[str]) -> Path:
+    """Create a repository checkout with a skills/<name>/SKILL.md per name."""
+    for name in names:
+        (root / "skills" / name).mkdir(parents=True)
+        (root / "skills" / name / "SKILL.md").write_text(f"# {name}\n")
+    return root
+
+
+def _metadata(names: list[str]) -> PluginMetadata:
+    return PluginMetadata(name="demo", version="1.0.0", description="", author="", skills=names)
+
+
+@pytest.fixture
+def skills_table(monkeypatch) -> FakeSkillsTable:
+    table = FakeSkillsTable()
+    monkeypatch.setattr(plugin_manager_module, "db", SimpleNamespace(skills=table))
+    return table
+
+
+class TestInstallSkillRecords:
+    """Tests for the batched skill record write in PluginManager._install_skills."""
+
+    async def test_records_are_written_in_one_batch(self, tmp_path: Path, skills_table: FakeSkillsTable):
+        """Test every uploaded skill is recorded through a single put_many call."""
+        names = ["alpha", "beta", "gamma"]
+        manager = PluginManager()
+        manager.skill_manager = FakeSkillManager()
+
+        skill_ids = await manager._install_skills(_skills_repo(tmp_path, names), _metadata(names))
+
+        assert skills_table.batches == [names]
+        assert skill_ids == ["id-alpha", "id-beta", "id-gamma"]
+
+    async def test_batch_failure_falls_back_to_single_writes(self, tmp_path: Path, skills_table: FakeSkillsTable):
+        """Test a failed batch is retried per skill, and unrecorded drafts are discarded."""
+        names = ["alpha", "beta", "gamma"]
+        skills_table.fail_batch = True
+        skills_table.failing_puts = ("beta",)
+        skill_manager = FakeSkillManager()
+        manager = PluginManager()
+        manager.skill_manager = skill_manager
+
+        skill_ids = await manager._install_skills(_skills_repo(tmp_path, names), _metadata(names))
+
+        assert skill_ids == ["id-alpha", "id-gamma"]
+        assert sorted(skills_table.items) == ["id-alpha", "id-gamma"]
+        assert skill_manager.discarded == ["beta"]
+
+
+class TestConcurrentSkillOps:
+    """Tests for the bounded concurrent install and removal of plugin skills."""
+
+    async def test_install_returns_ids_in_manifest_order(self, tmp_path: Path, skills_table: FakeSkillsTable):
+        """Test skill IDs follow the manifest even when uploads finish in reverse."""
+        names = [f"skill-{i}" for i in range(5)]
+        skill_manager = FakeSkillManager(upload_delays={name: 0.01 * (5 - i) for i, name in enumerate(names)})
+        manager = PluginManager()
+        manager.skill_manager = skill_manager
+
+        skill_ids = await manager._install_skills(_skills_repo(tmp_path, names), _metadata(names))
+
+        assert skill_manager.uploaded == list(reversed(names))
+        assert skill_ids == [f"id-{name}" for name in names]
+
+    async def test_install_concurrency_is_bounded(self, tmp_path: Path, skills_table: FakeSkillsTable):
+        """Test no more than MAX_CONCURRENT_SKILL_OPS uploads run at once."""
+        names = [f"skill-{i}" for i in range(PluginManager.MAX_CONCURRENT_SKILL_OPS * 2)]
+        skill_manager = FakeSkillManager(upload_delays={name: 0.01 for name in names})
+        manager = PluginManager()
+        manager.skill_manager = skill_manager
+
+        skill_ids = await manager._install_skills(_skills_repo(tmp_path, names), _metadata(names))
+
+        assert len(skill_ids) == len(names)
+        assert skill_manager.max_active == PluginManager.MAX_CONCURRENT_SKILL_OPS
+
+    async def test_install_skips_failed_and_invalid_skills(self, tmp_path: Path, skills_table: FakeSkillsTable):
+        """Test a failed upload, a missing folder and a folder without SKILL.md are skipped."""
+        repo = _skills_repo(tmp_path, ["alpha", "broken", "gamma"])
+        (repo / "skills" / "no-skill-md").mkdir()
+        names = ["alpha", "broken", "missing", "no-skill-md", "gamma"]
+        manager = PluginManager()
+        manager.skill_manager = FakeSkillManager(failing_uploads=("broken",))
+
+        skill_ids = await manager._install_skills(repo, _metadata(names))
+
+        assert skill_ids == ["id-alpha", "id-gamma"]
+        assert skills_table.batches == [["alpha", "gamma"]]
+
+    async def test_remove_counts_only_removed_skills(self, skills_table: FakeSkillsTable):
+        """Test removal survives S3 errors and reports DB failures as not removed."""
+        for name in ("alpha", "s3-fails", "db-fails"):
+            await skills_table.put({"name": name, "s3_location": f"s3://bucket/skills/{name}/"})
+        skills_table.failing_deletes = ("id-db-fails",)
+        skill_manager = FakeSkillManager(failing_deletes=("s3-fails",))
+        manager = PluginManager()
+        manager.skill_manager = skill_manager
+
+        removed = await manager._remove_skills(["id-alpha", "id-s3-fails", "id-db-fails", "id-missing"])
+
+        assert removed == 2
+        assert sorted(skills_table.items) == ["id-db-fails"]
+        assert sorted(skill_manager.deleted) == ["alpha", "db-fails"]
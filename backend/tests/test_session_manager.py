@@ -0,0 +1,49 @@
+"""Tests for session persistence."""
+import importlib
+from types import SimpleNamespace
+
+import pytest
+
+from core.session_manager import SessionManager
+
+# core re-exports the session_manager instance under the module's name
+session_manager_module = importlib.import_module("core.session_manager")
+
+
+class FakeSessionsTable:
+    """Sessions table stub that records written items."""
+
+    def __init__(self):
+        self.items: dict[str, dict] = {}
+
+    async def get(self, item_id):
+        return self.items.get(item_id)
+
+    async def put(self, item):
+        self.items[item["id"]] = dict(item)
+        return item
+
+
+@pytest.fixture
+def sessions(monkeypatch) -> FakeSessionsTable:
+    table = FakeSessionsTable()
+    monkeypatch.setattr(session_manager_module, "db", SimpleNamespace(sessions=table))
+    return table
+
+
+class TestStoreSession:
+    """Tests for SessionManager.store_session."""
+
+    async def test_omits_user_id_when_not_given(self, sessions: FakeSessionsTable):
+        """Test anonymous sessions leave out the user_id-index key instead of storing NULL."""
+        info = await SessionManager().store_session("s1", "agent-1")
+
+        assert "user_id" not in sessions.items["s1"]
+        assert info.user_id is None
+
+    async def test_stores_user_id_when_given(self, sessions: FakeSessionsTable):
+        """Test a real user_id is written so the session shows up in user_id-index."""
+        info = await SessionManager().store_session("s1", "agent-1", user_id="user-1")
+
+        assert sessions.items["s1"]["user_id"] == "user-1"
+        assert info.user_id == "user-1"
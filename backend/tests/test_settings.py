@@ -0,0 +1,173 @@
+"""Tests for settings API endpoints."""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import routers.settings as settings_module
+from core.secrets_store import InMemorySecretsStore
+from schemas.settings import SettingsResponse
+
+
+class FakeSettingsTable:
+    """Settings table stub with the get/patch semantics of DynamoDBTable."""
+
+    def __init__(self, record: dict | None = None):
+        self.record = dict(record) if record else None
+        self.gets = 0
+        self.patches: list[dict] = []
+
+    async def get(self, item_id):
+        self.gets += 1
+        return dict(self.record) if self.record else None
+
+    async def patch(self, item_id, changes):
+        self.patches.append(dict(changes))
+        now = datetime.now().isoformat()
+        record = self.record or {"id": item_id, "created_at": now}
+        self.record = {**record, **changes, "updated_at": now}
+        return dict(self.record)
+
+
+class FakeClock:
+    """Stand-in for the settings module's time, advanced by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def settings_table(monkeypatch) -> FakeSettingsTable:
+    """Fresh settings table, secrets store, clock and cache for each test."""
+    table = FakeSettingsTable()
+    monkeypatch.setattr(settings_module, "db", SimpleNamespace(settings=table))
+    monkeypatch.setattr(settings_module, "secrets_store", InMemorySecretsStore())
+    monkeypatch.setattr(settings_module, "time", FakeClock())
+    monkeypatch.setattr(settings_module, "_settings_cache", None)
+    monkeypatch.setattr(settings_module, "_settings_cache_ts", 0.0)
+    # No credentials from the environment, so *_set flags come from requests only
+    monkeypatch.setattr(settings_module, "_ENV_DEFAULT_RESPONSE", SettingsResponse())
+    return table
+
+
+class TestGetSettings:
+    """Tests for GET /api/settings endpoint."""
+
+    def test_returns_env_defaults_before_first_save(self, client: TestClient, settings_table):
+        """Test the environment-derived response is returned when nothing is stored."""
+        response = client.get("/api/settings")
+        assert response.status_code == 200
+        assert response.json() == SettingsResponse().model_dump()
+
+    def test_env_default_response_reflects_environment(self):
+        """Test the prebuilt default response reports env credentials as set flags only."""
+        env = settings_module.env_settings
+        default = settings_module._ENV_DEFAULT_RESPONSE
+        assert default.aws_region == env.aws_region
+        assert default.anthropic_api_key_set == bool(env.anthropic_api_key)
+        assert default.aws_secret_access_key_set == bool(env.aws_secret_access_key)
+        assert "anthropic_api_key" not in default.model_dump()
+
+    def test_fills_defaults_for_missing_stored_fields(self, client: TestClient, settings_table):
+        """Test a partial stored record is completed with field defaults."""
+        settings_table.record = {"id": "global", "aws_region": "eu-west-1", "anthropic_api_key_set": True}
+
+        data = client.get("/api/settings").json()
+
+        assert data == {
+            **SettingsResponse().model_dump(),
+            "aws_region": "eu-west-1",
+            "anthropic_api_key_set": True,
+        }
+
+    def test_cache_serves_reads_until_ttl_expires(self, client: TestClient, settings_table):
+        """Test repeated reads hit the database once per SETTINGS_CACHE_TTL_SECONDS."""
+        settings_table.record = {"id": "global", "aws_region": "eu-west-1"}
+
+        client.get("/api/settings")
+        client.get("/api/settings")
+        assert settings_table.gets == 1
+
+        settings_module.time.now += settings_module.SETTINGS_CACHE_TTL_SECONDS
+        settings_table.record["aws_region"] = "ap-south-1"
+        assert client.get("/api/settings").json()["aws_region"] == "ap-south-1"
+        assert settings_table.gets == 2
+
+
+class TestSettingsFlags:
+    """Tests for GET /api/settings/flags endpoint."""
+
+    def test_flags_follow_secrets_store_without_db_read(self, client: TestClient, settings_table):
+        """Test flags report stored secrets and never read the settings record."""
+        client.put("/api/settings", json={"aws_bearer_token": "token"})
+
+        response = client.get("/api/settings/flags")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "anthropic_api_key_set": False,
+            "aws_secret_access_key_set": False,
+            "aws_session_token_set": False,
+            "aws_bearer_token_set": True,
+        }
+        assert settings_table.gets == 0
+
+
+class TestUpdateSettings:
+    """Tests for PUT /api/settings endpoint."""
+
+    @pytest.mark.parametrize("body", [{}, {"aws_region": None, "anthropic_api_key": None}])
+    def test_empty_update_skips_write(self, client: TestClient, settings_table, body: dict):
+        """Test a PUT with every field omitted or null does not write."""
+        response = client.put("/api/settings", json=body)
+
+        assert response.status_code == 200
+        assert settings_table.patches == []
+
+    def test_writes_only_changed_fields(self, client: TestClient, settings_table):
+        """Test plain fields are patched as sent and secrets only as *_set flags."""
+        response = client.put("/api/settings", json={
+            "aws_region": "eu-west-1",
+            "anthropic_base_url": "",
+            "anthropic_api_key": "sk-test",
+        })
+
+        assert response.status_code == 200
+        assert settings_table.patches == [{
+            "aws_region": "eu-west-1",
+            "anthropic_base_url": None,
+            "anthropic_api_key_set": True,
+        }]
+        assert settings_module.secrets_store.get("anthropic_api_key") == "sk-test"
+        assert "sk-test" not in response.text
+        assert response.json()["anthropic_api_key_set"] is True
+
+    def test_clearing_secret_removes_it(self, client: TestClient, settings_table):
+        """Test an empty secret deletes it from the store and clears its flag."""
+        client.put("/api/settings", json={"aws_bearer_token": "token"})
+
+        data = client.put("/api/settings", json={"aws_bearer_token": ""}).json()
+
+        assert data["aws_bearer_token_set"] is False
+        assert not settings_module.secrets_store.has("aws_bearer_token")
+
+    def test_repeated_update_is_still_written(self, client: TestClient, settings_table):
+        """Test an update matching the cached record still reaches the database."""
+        client.put("/api/settings", json={"aws_region": "eu-west-1"})
+        client.put("/api/settings", json={"aws_region": "eu-west-1"})
+
+        assert len(settings_table.patches) == 2
+
+    def test_write_refreshes_cache(self, client: TestClient, settings_table):
+        """Test a read after a write is served from the written record."""
+        settings_table.record = {"id": "global", "aws_region": "eu-west-1"}
+        client.get("/api/settings")
+
+        client.put("/api/settings", json={"aws_region": "us-east-1"})
+
+        assert client.get("/api/settings").json()["aws_region"] == "us-east-1"
+        assert settings_table.gets == 1
@@ -0,0 +1,148 @@
+"""Tests for agent workspace symlinks, the skill manifest and the skill-name cache."""
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import core.workspace_manager as workspace_manager_module
+from core.workspace_manager import WorkspaceManager
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch) -> WorkspaceManager:
+    """WorkspaceManager rooted in a temporary directory with two skills."""
+    monkeypatch.setattr(workspace_manager_module, "settings", SimpleNamespace(
+        agent_workspace_dir=str(tmp_path / "workspace"),
+        agent_workspaces_dir=str(tmp_path / "agents"),
+    ))
+    skills_dir = tmp_path / "workspace" / ".claude" / "skills"
+    for name in ("alpha", "beta"):
+        (skills_dir / name).mkdir(parents=True)
+        (skills_dir / name / "SKILL.md").write_text(f"# {name}\n")
+    return WorkspaceManager()
+
+
+def _add_skill(manager: WorkspaceManager, name: str):
+    skill_dir = manager.main_skills_dir / name
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(f"# {name}\n")
+
+
+class TestGetAllSkillNames:
+    """Tests for the get_all_skill_names cache."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch) -> SimpleNamespace:
+        clock = SimpleNamespace(now=1000.0)
+        clock.monotonic = lambda: clock.now
+        monkeypatch.setattr(workspace_manager_module, "time", clock)
+        return clock
+
+    async def test_new_folder_is_seen_immediately(self, manager: WorkspaceManager, clock):
+        """Test adding a skill folder changes the directory mtime and forces a rescan."""
+        assert sorted(await manager.get_all_skill_names()) == ["alpha", "beta"]
+        _add_skill(manager, "gamma")
+        # Make sure the mtime differs even on coarse-grained filesystems
+        os.utime(manager.main_skills_dir, ns=(0, 0))
+
+        assert sorted(await manager.get_all_skill_names()) == ["alpha", "beta", "gamma"]
+
+    async def test_skill_md_in_existing_folder_is_seen_after_invalidate_or_ttl(
+        self, manager: WorkspaceManager, clock
+    ):
+        """Test SKILL.md written into an existing folder shows up on invalidate or TTL expiry."""
+        (manager.main_skills_dir / "gamma").mkdir()
+        assert sorted(await manager.get_all_skill_names()) == ["alpha", "beta"]
+        (manager.main_skills_dir / "gamma" / "SKILL.md").write_text("# gamma\n")
+
+        # The skills directory mtime did not change, so the cached list is served
+        assert sorted(await manager.get_all_skill_names()) == ["alpha", "beta"]
+
+        manager.invalidate_skill_cache()
+        assert sorted(await manager.get_all_skill_names()) == ["alpha", "beta", "gamma"]
+
+        (manager.main_skills_dir / "gamma" / "SKILL.md").unlink()
+        clock.now += WorkspaceManager.SKILLS_CACHE_TTL_SECONDS
+        assert sorted(await manager.get_all_skill_names()) == ["alpha", "beta"]
+
+
+class TestRebuildAgentWorkspace:
+    """Tests for the incremental symlink diff in rebuild_agent_workspace."""
+
+    async def test_links_all_skills_and_writes_manifest(self, manager: WorkspaceManager):
+        """Test every skill is linked and recorded outside the agent workspace."""
+        await manager.rebuild_agent_workspace("agent-1", [], allow_all_skills=True)
+
+        skills_dir = manager.get_agent_skills_dir("agent-1")
+        assert sorted(os.listdir(skills_dir)) == ["alpha", "beta"]
+        assert os.readlink(skills_dir / "alpha") == str(manager.main_skills_dir_abs / "alpha")
+
+        manifest_path = manager._get_skill_manifest_path("agent-1")
+        assert manager.get_agent_workspace("agent-1") not in manifest_path.parents
+        assert json.loads(manifest_path.read_text()) == ["alpha", "beta"]
+
+    async def test_keeps_existing_links_and_replaces_stale_entries(self, manager: WorkspaceManager):
+        """Test unchanged links are kept while stale and wrong entries are replaced."""
+        await manager.rebuild_agent_workspace("agent-1", [], allow_all_skills=True)
+        skills_dir = manager.get_agent_skills_dir("agent-1")
+        alpha_inode = os.lstat(skills_dir / "alpha").st_ino
+
+        # beta is removed upstream, gamma is added, and a stray directory shadows gamma
+        (manager.main_skills_dir / "beta" / "SKILL.md").unlink()
+        (manager.main_skills_dir / "beta").rmdir()
+        _add_skill(manager, "gamma")
+        (skills_dir / "gamma").mkdir()
+        manager.invalidate_skill_cache()
+
+        await manager.rebuild_agent_workspace("agent-1", [], allow_all_skills=True)
+
+        assert sorted(os.listdir(skills_dir)) == ["alpha", "gamma"]
+        assert os.lstat(skills_dir / "alpha").st_ino == alpha_inode
+        assert os.path.islink(skills_dir / "gamma")
+        manifest_path = manager._get_skill_manifest_path("agent-1")
+        assert json.loads(manifest_path.read_text()) == ["alpha", "gamma"]
+
+
+class TestDeleteAgentWorkspace:
+    """Tests for deleting an agent workspace through its manifest."""
+
+    async def test_removes_links_workspace_and_manifest(self, manager: WorkspaceManager):
+        """Test the workspace and its manifest are removed, leaving skills intact."""
+        await manager.rebuild_agent_workspace("agent-1", [], allow_all_skills=True)
+
+        await manager.delete_agent_workspace("agent-1")
+
+        assert not manager.get_agent_workspace("agent-1").exists()
+        assert not manager._get_skill_manifest_path("agent-1").exists()
+        assert (manager.main_skills_dir / "alpha" / "SKILL.md").is_file()
+
+    @pytest.mark.parametrize("bad_name", ["../../../../victim.txt", "..", ".", "", "nested/alpha"])
+    async def test_ignores_manifest_entries_outside_skills_dir(
+        self, manager: WorkspaceManager, tmp_path: Path, bad_name: str
+    ):
+        """Test a tampered manifest cannot delete files outside the workspace."""
+        victim = tmp_path / "victim.txt"
+        victim.write_text("keep me")
+        await manager.rebuild_agent_workspace("agent-1", [], allow_all_skills=True)
+        manager._get_skill_manifest_path("agent-1").write_text(json.dumps(["alpha", bad_name]))
+
+        assert manager._remove_linked_workspace("agent-1") is False
+
+        assert victim.read_text() == "keep me"
+        assert os.path.islink(manager.get_agent_skills_dir("agent-1") / "alpha")
+
+    async def test_only_symlinks_are_unlinked(self, manager: WorkspaceManager):
+        """Test a regular file named in the manifest is left for the rmtree fallback."""
+        await manager.rebuild_agent_workspace("agent-1", [], allow_all_skills=True)
+        skills_dir = manager.get_agent_skills_dir("agent-1")
+        (skills_dir / "notes.txt").write_text("agent output")
+        manager._get_skill_manifest_path("agent-1").write_text(json.dumps(["alpha", "notes.txt"]))
+
+        assert manager._remove_linked_workspace("agent-1") is False
+        assert (skills_dir / "notes.txt").read_text() == "agent output"
+
+        await manager.delete_agent_workspace("agent-1")
+        assert not manager.get_agent_workspace("agent-1").exists()
+        assert (manager.main_skills_dir / "alpha" / "SKILL.md").is_file()
@@ -93,6 +93,54 @@ enable_ttl_on_table() {
     fi
 }
 
+# Create a global secondary index on a DynamoDB table if it doesn't exist
+# Usage: create_gsi_if_not_exists TABLE INDEX HASH_ATTR HASH_TYPE RANGE_ATTR RANGE_TYPE
+create_gsi_if_not_exists() {
+    local TABLE_NAME=$1
+    local INDEX_NAME=$2
+    local HASH_ATTR=$3
+    local HASH_TYPE=$4
+    local RANGE_ATTR=$5
+    local RANGE_TYPE=$6
+    local REGION=${AWS_REGION:-us-west-2}
+
+    # Existing index's hash and range attribute names, then the table's types
+    # for the expected attributes ("None" for anything missing)
+    local EXISTING=$(aws dynamodb describe-table \
+        --table-name "$TABLE_NAME" \
+        --region "$REGION" \
+        --query "Table.[GlobalSecondaryIndexes[?IndexName=='$INDEX_NAME'] | [0].KeySchema[?KeyType=='HASH'] | [0].AttributeName, GlobalSecondaryIndexes[?IndexName=='$INDEX_NAME'] | [0].KeySchema[?KeyType=='RANGE'] | [0].AttributeName, AttributeDefinitions[?AttributeName=='$HASH_ATTR'] | [0].AttributeType, AttributeDefinitions[?AttributeName=='$RANGE_ATTR'] | [0].AttributeType]" \
+        --output text 2>/dev/null | tr '\t' ' ')
+    local EXPECTED="$HASH_ATTR $RANGE_ATTR $HASH_TYPE $RANGE_TYPE"
+
+    if [ "$EXISTING" = "$EXPECTED" ]; then
+        echo "  ✅ Index $INDEX_NAME already exists on $TABLE_NAME"
+        return 0
+    fi
+    if [ -n "$EXISTING" ] && [[ "$EXISTING" != "None None "* ]]; then
+        # Never accept an index by name alone: queries rely on its key schema
+        echo "  ⚠️  Index $INDEX_NAME on $TABLE_NAME has keys/types ($EXISTING), expected ($EXPECTED)"
+        echo "  💡 Delete the index and re-run this script to recreate it; queries fall back to scans until then"
+        return 0
+    fi
+
+    echo "  📇 Creating index $INDEX_NAME on $TABLE_NAME ($HASH_ATTR, $RANGE_ATTR)..."
+    aws dynamodb update-table \
+        --table-name "$TABLE_NAME" \
+        --attribute-definitions \
+            AttributeName="$HASH_ATTR",AttributeType="$HASH_TYPE" \
+            AttributeName="$RANGE_ATTR",AttributeType="$RANGE_TYPE" \
+        --global-secondary-index-updates \
+            "[{\"Create\":{\"IndexName\":\"$INDEX_NAME\",\"KeySchema\":[{\"AttributeName\":\"$HASH_ATTR\",\"KeyType\":\"HASH\"},{\"AttributeName\":\"$RANGE_ATTR\",\"KeyType\":\"RANGE\"}],\"Projection\":{\"ProjectionType\":\"ALL\"}}}]" \
+        --region "$REGION" > /dev/null 2>&1
+
+    if [ $? -eq 0 ]; then
+        echo "  ✅ Index $INDEX_NAME is being created on $TABLE_NAME (backfills in the background)"
+    else
+        echo "  ⚠️  Could not create index $INDEX_NAME on $TABLE_NAME (may require permissions)"
+    fi
+}
+
 # Update S3_BUCKET in .env with account ID
 update_s3_bucket_with_account_id() {
     local ENV_FILE="${SCRIPT_DIR}/backend/.env"
@@ -218,16 +266,22 @@ init_aws_resources() {
 
     if [ -n "$DYNAMODB_SESSIONS_TABLE" ]; then
         create_dynamodb_table_if_not_exists "$DYNAMODB_SESSIONS_TABLE"
+        # Per-user session listing, ordered by creation time
+        create_gsi_if_not_exists "$DYNAMODB_SESSIONS_TABLE" "user_id-index" user_id S created_at S
     fi
 
     if [ -n "$DYNAMODB_MESSAGES_TABLE" ]; then
         create_dynamodb_table_if_not_exists "$DYNAMODB_MESSAGES_TABLE"
         # Enable TTL on messages table (items expire after 7 days)
         enable_ttl_on_table "$DYNAMODB_MESSAGES_TABLE" "expires_at"
+        # Per-session message history, streamed in creation order
+        create_gsi_if_not_exists "$DYNAMODB_MESSAGES_TABLE" "session_id-index" session_id S created_at S
     fi
 
     if [ -n "$DYNAMODB_SKILL_VERSIONS_TABLE" ]; then
         create_dynamodb_table_if_not_exists "$DYNAMODB_SKILL_VERSIONS_TABLE"
+        # Versions of a skill, ordered by version number
+        create_gsi_if_not_exists "$DYNAMODB_SKILL_VERSIONS_TABLE" "skill_id-index" skill_id S version N
     fi
 
     if [ -n "$DYNAMODB_PLUGINS_TABLE" ]; then